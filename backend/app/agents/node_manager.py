@@ -5,9 +5,17 @@ within a workflow, keeping the main orchestration code concise.
 """
 from __future__ import annotations
 
-from typing import Optional
+import asyncio
+import logging
+import time
+from typing import Any, Optional
 
-from app.api.websockets.broadcast import broadcast_commentary, broadcast_node_update
+from app.api.websockets.broadcast import (
+    broadcast_commentary,
+    broadcast_commentary_chunk,
+    broadcast_node_batch,
+    broadcast_node_update,
+)
 from app.models.agent_node import AgentNode, NodeData, NodeStatus, NodeType
 from app.state.workflow_state import workflow_state_manager
 from app.utils.logging import get_logger
@@ -22,31 +30,68 @@ class NodeManager:  # noqa: D101
     # ------------------------------------------------------------------
     # Creation helpers
     # ------------------------------------------------------------------
+    @staticmethod
+    def _build_node(
+        label: str,
+        node_type: NodeType,
+        parent_id: Optional[str] = None,
+        data: Optional[dict[str, object]] = None,
+        description: Optional[str] = None,
+    ) -> AgentNode:
+        # Inputs come from our own code, so skip Pydantic validation entirely.
+        data = data or {}
+        node_data = NodeData.model_construct(
+            description=description or data.get("description"),
+            input=data,  # store full original payload
+        )
+        return AgentNode.model_construct(
+            label=label, type=node_type, parent_id=parent_id, data=node_data
+        )
+
     async def create_node(
         self,
         label: str,
         node_type: NodeType,
         parent_id: Optional[str] = None,
         data: Optional[dict[str, object]] = None,
+        description: Optional[str] = None,
     ) -> AgentNode:
         """Create a new node, persist it, and broadcast its creation."""
 
-        data = data or {}
-        node_data = NodeData(
-            description=data.get("description"),
-            input=data,  # store full original payload
+        node = self._build_node(label, node_type, parent_id, data, description)
+
+        await asyncio.gather(
+            workflow_state_manager.add_node_to_workflow_async(self.workflow_id, node),
+            broadcast_node_update(self.workflow_id, node),
         )
-        node = AgentNode(label=label, type=node_type, parent_id=parent_id, data=node_data)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Created and broadcasted new node %s ('%s') for workflow %s",
+                node.id,
+                label,
+                self.workflow_id,
+            )
+        return node
+
+    async def create_nodes(self, specs: list[dict[str, Any]]) -> list[AgentNode]:
+        """Create several nodes at once and announce them in a single broadcast.
 
-        workflow_state_manager.add_node_to_workflow(self.workflow_id, node)
-        await broadcast_node_update(self.workflow_id, node)
+        Each spec holds the keyword arguments accepted by `create_node`.
+        """
+
+        nodes = [self._build_node(**spec) for spec in specs]
+        if nodes:
+            await asyncio.gather(
+                *(
+                    workflow_state_manager.add_node_to_workflow_async(self.workflow_id, node)
+                    for node in nodes
+                ),
+                broadcast_node_batch(self.workflow_id, nodes),
+            )
         logger.info(
-            "Created and broadcasted new node %s ('%s') for workflow %s",
-            node.id,
-            label,
-            self.workflow_id,
+            "Created and broadcasted %d new nodes for workflow %s", len(nodes), self.workflow_id
         )
-        return node
+        return nodes
 
     # ------------------------------------------------------------------
     # Update helpers
@@ -56,15 +101,30 @@ class NodeManager:  # noqa: D101
     ) -> None:
         """Update a node's status, persist, and broadcast."""
 
+        newly_completed = status == NodeStatus.COMPLETED and node.status != NodeStatus.COMPLETED
         node.status = status
+        if status == NodeStatus.PROCESSING:
+            if node.started_ns is None:
+                node.started_ns = time.monotonic_ns()
+        elif status in (NodeStatus.COMPLETED, NodeStatus.FAILED):
+            node.completed_ns = time.monotonic_ns()
         if error:
             node.data.error = error
+        if newly_completed and node.type == NodeType.TOOL:
+            workflow_state_manager.record_tool_output(self.workflow_id, node)
 
-        workflow_state_manager.update_node_in_workflow(self.workflow_id, node)
-        await broadcast_node_update(self.workflow_id, node)
-        logger.info(
-            "Updated node %s status to %s for workflow %s", node.id, status.value, self.workflow_id
+        await asyncio.gather(
+            workflow_state_manager.update_node_in_workflow_async(self.workflow_id, node),
+            broadcast_node_update(self.workflow_id, node),
         )
+        # Called for every state transition; skip building log args when INFO is off.
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Updated node %s status to %s for workflow %s",
+                node.id,
+                status.value,
+                self.workflow_id,
+            )
 
     # ------------------------------------------------------------------
     # Commentary helpers
@@ -76,3 +136,8 @@ class NodeManager:  # noqa: D101
 
         commentary = {"title": title, "content": content, "severity": severity}
         await broadcast_commentary(self.workflow_id, commentary)
+
+    async def stream_commentary(self, title: str, chunk: str) -> None:
+        """Broadcast a partial commentary chunk (e.g. streamed LLM output)."""
+
+        await broadcast_commentary_chunk(self.workflow_id, title, chunk)
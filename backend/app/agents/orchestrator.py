@@ -6,15 +6,18 @@ Gemini LLM and tool execution services.
 from __future__ import annotations
 
 import asyncio
-import json
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
+
+import orjson
 
 from app.agents.node_manager import NodeManager
+from app.agents.runtime import WorkflowRuntime
 from app.core.config import get_settings
-from app.core.exceptions import LLMResponseError
-from app.llm.gemini_client import GeminiClient
+from app.core.exceptions import LLMResponseError, ToolExecutionError
+from app.llm.gemini_client import GeminiClient, get_gemini_client
+from app.llm.plan_cache import plan_cache
 from app.llm.prompt_templates import get_planner_prompt, get_synthesizer_prompt
-from app.models.agent_node import NodeStatus, NodeType
+from app.models.agent_node import AgentNode, NodeStatus, NodeType
 from app.state.workflow_state import workflow_state_manager
 from app.utils.logging import get_logger
 
@@ -25,33 +28,54 @@ settings = get_settings()
 class ToolExecutorClient:  # noqa: D101
     async def execute_tool(self, tool_name: str, parameters: Dict[str, Any]):  # noqa: D401
         logger.info("MOCK EXECUTING tool '%s' with params: %s", tool_name, parameters)
-        await asyncio.sleep(2)
+        if settings.MOCK_TOOL_LATENCY_S:
+            await asyncio.sleep(settings.MOCK_TOOL_LATENCY_S)
         return {"status": "success", "output": f"Mock result for {tool_name}"}
 
 
 class AgentOrchestrator:  # noqa: D101
-    def __init__(self, workflow_id: str) -> None:  # noqa: D401
+    def __init__(
+        self, workflow_id: str, llm_client: Optional[GeminiClient] = None
+    ) -> None:  # noqa: D401
         self.workflow_id = workflow_id
         self.workflow = workflow_state_manager.get_workflow(workflow_id)
         self.node_manager = NodeManager(workflow_id)
-        self.llm_client = GeminiClient(settings)
+        self.llm_client = llm_client or get_gemini_client(settings)
         self.tool_executor = ToolExecutorClient()
+        self._query_embedding: Optional[List[float]] = None
+        self._plan_from_cache = False
+        # Scheduler state for the plan, built while the plan is validated
+        self._runtime: Optional[WorkflowRuntime] = None
 
     # ---------------------------------------------------------------------
     # Public API
     # ---------------------------------------------------------------------
     async def run(self) -> None:  # noqa: D401
         try:
-            plan = await self._planning_phase()
-            if plan and plan.get("nodes"):
-                await self._execution_phase(plan)
-            else:
+            try:
+                plan = await self._planning_phase()
+                if plan and plan.get("nodes"):
+                    await self._execution_phase(plan)
+                else:
+                    await self.node_manager.add_commentary(
+                        title="Planning Skipped",
+                        content="No actionable plan was generated. Attempting direct answer.",
+                        severity="warn",
+                    )
+                synthesized = await self._synthesis_phase()
+                if synthesized and plan and plan.get("nodes"):
+                    await self._cache_plan(plan)
+            except* ToolExecutionError as group:
+                # Raised by the execution TaskGroup; remaining steps were cancelled.
+                errors = "; ".join(str(exc) for exc in group.exceptions)
+                logger.error(
+                    "Workflow %s aborted after a step failed: %s", self.workflow_id, errors
+                )
                 await self.node_manager.add_commentary(
-                    title="Planning Skipped",
-                    content="No actionable plan was generated. Attempting direct answer.",
-                    severity="warn",
+                    title="Workflow Failed",
+                    content=f"A step failed and the remaining steps were cancelled: {errors}",
+                    severity="error",
                 )
-            await self._synthesis_phase()
         except Exception as exc:  # noqa: BLE001
             logger.error(
                 "Workflow %s failed with unhandled exception: %s", self.workflow_id, exc, exc_info=True
@@ -69,21 +93,40 @@ class AgentOrchestrator:  # noqa: D101
         """
         Handles the planning stage. It can now result in a direct answer or a plan.
         """
-        await self.node_manager.add_commentary(
-            title="Planning Started",
-            content="Generating an execution plan or a direct answer."
-        )
-        planner_node = await self.node_manager.create_node(
-            label="Planning",
-            node_type=NodeType.ORCHESTRATOR,
-            description="Contacting LLM to analyze query.",
-            parent_id=None
-        )
-        await self.node_manager.update_node_status(planner_node, NodeStatus.PROCESSING)
+        # Start the planner request first so that the commentary and node
+        # broadcasts below overlap with the LLM round-trip.
+        plan_task = asyncio.create_task(self._fetch_plan())
+        try:
+            await self.node_manager.add_commentary(
+                title="Planning Started",
+                content="Generating an execution plan or a direct answer."
+            )
+            planner_node = await self.node_manager.create_node(
+                label="Planning",
+                node_type=NodeType.ORCHESTRATOR,
+                description="Contacting LLM to analyze query.",
+                parent_id=None
+            )
+            await self.node_manager.update_node_status(planner_node, NodeStatus.PROCESSING)
+        except BaseException:
+            plan_task.cancel()
+            # Wait for the planner to stop and consume its outcome (including an
+            # exception it may already have raised) before propagating.
+            await asyncio.gather(plan_task, return_exceptions=True)
+            raise
 
         try:
-            prompt = get_planner_prompt(self.workflow.query)
-            response_json = await self.llm_client.generate_plan(prompt) # This function name is now more generic
+            response_json = await plan_task
+            if "direct_answer" not in response_json:
+                # Reject unusable plans (e.g. dependency cycles) before any step is announced.
+                self._runtime = WorkflowRuntime.from_plan(response_json)
+            if self._plan_from_cache:
+                await self.node_manager.update_node_status(planner_node, NodeStatus.COMPLETED)
+                await self.node_manager.add_commentary(
+                    title="Planning Complete",
+                    content=f"Reused a cached plan with {len(response_json.get('nodes', []))} steps."
+                )
+                return response_json
 
             # --- THIS IS THE NEW LOGIC ---
             if "direct_answer" in response_json:
@@ -106,53 +149,153 @@ class AgentOrchestrator:  # noqa: D101
             )
             return response_json
 
-        except (LLMResponseError, json.JSONDecodeError) as e:
+        except (LLMResponseError, orjson.JSONDecodeError) as e:
             error_message = f"Failed to generate or parse a valid response from the LLM: {e}"
             logger.error(f"Workflow {self.workflow_id}: {error_message}")
             await self.node_manager.update_node_status(planner_node, NodeStatus.FAILED, error=error_message)
             return None
 
+    async def _fetch_plan(self) -> dict:
+        """Return a cached plan for the query, or ask the LLM for a new one."""
+
+        cached_plan = await self._lookup_cached_plan()
+        if cached_plan is not None:
+            self._plan_from_cache = True
+            return cached_plan
+
+        prompt = get_planner_prompt(self.workflow.query)
+        return await self.llm_client.generate_plan(prompt)  # may also return a direct answer
+
+    async def _lookup_cached_plan(self) -> Optional[dict]:
+        """Return a previously successful plan for a similar query, if any."""
+
+        if not settings.PLAN_CACHE_ENABLED:
+            return None
+        try:
+            self._query_embedding = await plan_cache.embed(self.workflow.query)
+            return await plan_cache.lookup(self._query_embedding)
+        except Exception as exc:  # noqa: BLE001
+            # The cache is an optimisation only; fall back to the planner.
+            logger.warning("Plan cache lookup failed for workflow %s: %s", self.workflow_id, exc)
+            return None
+
+    async def _cache_plan(self, plan: dict[str, Any]) -> None:
+        """Store a freshly generated plan once the workflow has fully succeeded."""
+
+        if self._plan_from_cache or self._query_embedding is None:
+            return
+
+        workflow_state = workflow_state_manager.get_workflow(self.workflow_id)
+        if any(
+            node.type == NodeType.TOOL and node.status == NodeStatus.FAILED
+            for node in workflow_state.node_tree.values()
+        ):
+            return
+
+        try:
+            await plan_cache.store(self.workflow.query, self._query_embedding, plan)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Failed to cache plan for workflow %s: %s", self.workflow_id, exc)
+
     async def _execution_phase(self, plan: dict[str, Any]) -> None:
         await self.node_manager.add_commentary(
             title="Execution Started", content="Beginning execution of planned steps."
         )
 
-        # Pre-create nodes in WAITING state
-        tool_nodes: dict[str, Any] = {}
-        for node_data in plan.get("nodes", []):
-            node = await self.node_manager.create_node(
-                label=node_data.get("label", "Step"),
-                node_type=NodeType.TOOL,
-                parent_id=None,
-                data=node_data.get("data", {}),
-            )
-            tool_nodes[node_data["id"]] = node
-
-        # Execute sequentially
-        for node_id in sorted(tool_nodes):
-            node = tool_nodes[node_id]
-            await self.node_manager.update_node_status(node, NodeStatus.PROCESSING)
-            tool_name = node.data.description.get("tool_name")
-            parameters = node.data.description.get("parameters")
-            if not tool_name:
+        # Pre-create nodes in WAITING state, announced to clients in one batch
+        plan_nodes = plan.get("nodes", [])
+        created = await self.node_manager.create_nodes(
+            [
+                {
+                    "label": node_data.get("label", "Step"),
+                    "node_type": NodeType.TOOL,
+                    "parent_id": None,
+                    "data": node_data.get("data", {}),
+                }
+                for node_data in plan_nodes
+            ]
+        )
+        tool_nodes: dict[str, AgentNode] = {
+            node_data["id"]: node for node_data, node in zip(plan_nodes, created)
+        }
+
+        # Ready-set scheduling: each step starts as soon as all of its
+        # dependencies have completed, independent of unrelated branches.
+        runtime = self._runtime
+
+        # A step that raises cancels every running step and aborts the run.
+        try:
+            async with asyncio.TaskGroup() as tg:
+
+                async def run(node_id: str) -> None:
+                    try:
+                        completed = await self._run_tool(tool_nodes[node_id])
+                    except BaseException:
+                        # Record the failure so the runtime never leaves this
+                        # step's descendants undecided; the sweep below fails them.
+                        runtime.settle(node_id, False)
+                        raise
+                    ready, blocked = runtime.settle(node_id, completed)
+                    for blocked_id in blocked:
+                        await self.node_manager.update_node_status(
+                            tool_nodes[blocked_id],
+                            NodeStatus.FAILED,
+                            error="Upstream dependency failed.",
+                        )
+                    for ready_id in ready:
+                        tg.create_task(run(ready_id))
+
+                for node_id in runtime.roots():
+                    tg.create_task(run(node_id))
+        except BaseException:
+            # Steps that never started, or were cancelled before recording a
+            # result, would otherwise be left WAITING/PROCESSING forever.
+            for node_id, node in tool_nodes.items():
+                if node.status in (NodeStatus.COMPLETED, NodeStatus.FAILED):
+                    continue
+                runtime.status_by_id[node_id] = NodeStatus.FAILED.value
                 await self.node_manager.update_node_status(
-                    node, NodeStatus.FAILED, error="Tool name missing in plan."
+                    node, NodeStatus.FAILED, error="Cancelled after another step failed."
                 )
-                continue
+            raise
+
+    async def _run_tool(self, node: AgentNode) -> bool:
+        """Execute a single tool node, returning True if it completed."""
 
+        await self.node_manager.update_node_status(node, NodeStatus.PROCESSING)
+        tool_name = node.data.input.get("tool_name")
+        parameters = node.data.input.get("parameters") or {}
+        if not tool_name:
+            await self.node_manager.update_node_status(
+                node, NodeStatus.FAILED, error="Tool name missing in plan."
+            )
+            return False
+
+        try:
             result = await self.tool_executor.execute_tool(tool_name, parameters)
-            node.data.output = result
-            if result.get("status") == "success":
-                await self.node_manager.update_node_status(node, NodeStatus.COMPLETED)
-            else:
-                await self.node_manager.update_node_status(
-                    node, NodeStatus.FAILED, error=str(result.get("output"))
-                )
+        except asyncio.CancelledError:
+            await self.node_manager.update_node_status(
+                node, NodeStatus.FAILED, error="Cancelled after another step failed."
+            )
+            raise
+        except Exception as exc:  # noqa: BLE001
+            await self.node_manager.update_node_status(node, NodeStatus.FAILED, error=str(exc))
+            raise ToolExecutionError(tool_name, str(exc)) from exc
+
+        node.data.output = result
+        if result.get("status") == "success":
+            await self.node_manager.update_node_status(node, NodeStatus.COMPLETED)
+            return True
+
+        await self.node_manager.update_node_status(
+            node, NodeStatus.FAILED, error=str(result.get("output"))
+        )
+        return False
 
-    async def _synthesis_phase(self):
+    async def _synthesis_phase(self) -> bool:
         """
         Gathers all tool results, sends them to the LLM for a final answer,
-        and broadcasts the result.
+        and broadcasts the result. Returns True if a final answer was produced.
         """
         synthesis_node = await self.node_manager.create_node(
             label="Synthesize Final Answer",
@@ -162,15 +305,9 @@ class AgentOrchestrator:  # noqa: D101
         await self.node_manager.update_node_status(synthesis_node, NodeStatus.PROCESSING)
 
         try:
-            # Gather all the outputs from the completed tool nodes
+            # Outputs of completed tool nodes are collected as each one finishes
             workflow_state = workflow_state_manager.get_workflow(self.workflow_id)
-            collected_data: list[dict[str, Any]] = []
-            for node in workflow_state.node_tree.values():
-                if node.type == NodeType.TOOL and node.status == NodeStatus.COMPLETED:
-                    collected_data.append({
-                        "step": node.label,
-                        "result": node.data.output
-                    })
+            collected_data: list[dict[str, Any]] = workflow_state.completed_tool_outputs
 
             # If no data was collected, create a default response
             if not collected_data:
@@ -179,8 +316,12 @@ class AgentOrchestrator:  # noqa: D101
                 # Create the prompt for the synthesizer
                 prompt = get_synthesizer_prompt(self.workflow.query, collected_data)
 
-                # Make the LLM call to get the final answer
-                final_answer = await self.llm_client.generate_synthesis(prompt)
+                # Stream the answer to clients as it is generated
+                chunks: list[str] = []
+                async for chunk in self.llm_client.generate_synthesis_stream(prompt):
+                    chunks.append(chunk)
+                    await self.node_manager.stream_commentary(title="Final Answer", chunk=chunk)
+                final_answer = "".join(chunks).strip()
 
             # Update the synthesis node and broadcast the final answer
             synthesis_node.data.output = {"final_answer": final_answer}
@@ -192,8 +333,10 @@ class AgentOrchestrator:  # noqa: D101
                 severity="success"
             )
             logger.info(f"Workflow {self.workflow_id} completed successfully.")
+            return True
 
         except Exception as e:  # noqa: BLE001
             error_message = f"Failed during synthesis phase: {e}"
             logger.error(error_message, exc_info=True)
             await self.node_manager.update_node_status(synthesis_node, NodeStatus.FAILED, error=error_message)
+            return False
@@ -0,0 +1,123 @@
+"""Scheduler state for executing a plan's DAG.
+
+`WorkflowRuntime` holds the few facts the ready-set scheduler reads on every
+step completion (parents, children, outstanding dependency counts, and status)
+as flat dicts keyed by plan node ID. The scheduler never has to touch the
+`AgentNode` models to decide what runs next; those are only read and written
+when a node's state is persisted and broadcast.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Set, Tuple
+
+from app.core.exceptions import LLMResponseError
+from app.models.agent_node import NodeStatus
+
+
+@dataclass(slots=True)
+class WorkflowRuntime:
+    """Dependency bookkeeping for one execution of a plan."""
+
+    parents_by_id: Dict[str, Tuple[str, ...]]
+    children_by_id: Dict[str, Tuple[str, ...]]
+    pending_parent_count: Dict[str, int]
+    status_by_id: Dict[str, str]
+    # Nodes with at least one parent that did not complete
+    upstream_failed: Set[str] = field(default_factory=set)
+
+    @classmethod
+    def from_plan(cls, plan: Dict[str, Any]) -> "WorkflowRuntime":
+        """Build the runtime for ``plan``, rejecting malformed or cyclic plans.
+
+        Dependencies are taken from each node's optional ``depends_on`` list and
+        from the plan's ``edges``; references to unknown nodes are ignored.
+        """
+
+        if not isinstance(plan, dict):
+            raise LLMResponseError("Execution plan must be a JSON object.")
+        parents: Dict[str, Set[str]] = {}
+        for node_data in plan.get("nodes") or []:
+            node_id = node_data.get("id") if isinstance(node_data, dict) else None
+            if not isinstance(node_id, str):
+                raise LLMResponseError("Every plan node needs a string 'id'.")
+            if node_id in parents:
+                raise LLMResponseError(f"Plan node id '{node_id}' is used more than once.")
+            parents[node_id] = set()
+        for node_data in plan.get("nodes") or []:
+            for dep in node_data.get("depends_on") or []:
+                if dep in parents:
+                    parents[node_data["id"]].add(dep)
+        for edge in plan.get("edges") or []:
+            if not isinstance(edge, dict):
+                continue
+            src, dst = edge.get("from"), edge.get("to")
+            if src in parents and dst in parents:
+                parents[dst].add(src)
+
+        children: Dict[str, List[str]] = {node_id: [] for node_id in parents}
+        for node_id, deps in parents.items():
+            for dep in deps:
+                children[dep].append(node_id)
+
+        runtime = cls(
+            parents_by_id={node_id: tuple(deps) for node_id, deps in parents.items()},
+            children_by_id={node_id: tuple(kids) for node_id, kids in children.items()},
+            pending_parent_count={node_id: len(deps) for node_id, deps in parents.items()},
+            status_by_id={node_id: NodeStatus.WAITING.value for node_id in parents},
+        )
+        runtime._check_acyclic()
+        return runtime
+
+    def _check_acyclic(self) -> None:
+        # Kahn's algorithm: every node is reachable from a root unless there is a cycle.
+        remaining = dict(self.pending_parent_count)
+        ready = [node_id for node_id, count in remaining.items() if not count]
+        visited = 0
+        while ready:
+            node_id = ready.pop()
+            visited += 1
+            for child in self.children_by_id[node_id]:
+                remaining[child] -= 1
+                if not remaining[child]:
+                    ready.append(child)
+        if visited != len(remaining):
+            raise LLMResponseError("Execution plan contains a dependency cycle.")
+
+    def roots(self) -> List[str]:
+        """Return the nodes with no dependencies, marking them as dispatched."""
+
+        ready = [node_id for node_id, count in self.pending_parent_count.items() if not count]
+        for node_id in ready:
+            self.status_by_id[node_id] = NodeStatus.PROCESSING.value
+        return ready
+
+    def settle(self, node_id: str, completed: bool) -> Tuple[List[str], List[str]]:
+        """Record that ``node_id`` finished and release its children.
+
+        Returns ``(ready, blocked)``: children whose dependencies are now all
+        complete and should be dispatched, and descendants that can never run
+        because an upstream step failed (already marked failed here).
+        """
+
+        ready: List[str] = []
+        blocked: List[str] = []
+        worklist = [(node_id, completed)]
+        while worklist:
+            current, ok = worklist.pop()
+            self.status_by_id[current] = (
+                NodeStatus.COMPLETED.value if ok else NodeStatus.FAILED.value
+            )
+            for child in self.children_by_id[current]:
+                if not ok:
+                    self.upstream_failed.add(child)
+                self.pending_parent_count[child] -= 1
+                if self.pending_parent_count[child]:
+                    continue
+                if child in self.upstream_failed:
+                    blocked.append(child)
+                    worklist.append((child, False))
+                else:
+                    self.status_by_id[child] = NodeStatus.PROCESSING.value
+                    ready.append(child)
+        return ready, blocked
@@ -8,8 +8,9 @@ from __future__ import annotations
 from fastapi import APIRouter, Depends
 from pydantic import BaseModel, Field
 
-from app.core.dependencies import get_app_settings
+from app.core.dependencies import get_app_settings, get_llm_client
 from app.core.config import Settings
+from app.llm.gemini_client import GeminiClient
 from app.services.workflow_service import workflow_service
 from app.utils.logging import get_logger
 
@@ -39,6 +40,7 @@ class ChatResponse(BaseModel):  # noqa: D101
 async def initiate_chat_workflow(
     request: ChatRequest,
     settings: Settings = Depends(get_app_settings),  # noqa: ARG001  # settings can be used later
+    llm_client: GeminiClient = Depends(get_llm_client),
 ):
     """HTTP handler that kicks off a workflow."""
 
@@ -47,6 +49,6 @@ async def initiate_chat_workflow(
     )
 
     workflow_id = await workflow_service.start_workflow(
-        session_id=request.session_id, query=request.query
+        session_id=request.session_id, query=request.query, llm_client=llm_client
     )
     return ChatResponse(workflow_id=workflow_id)
@@ -1,24 +1,33 @@
 """
 Broadcasting service for sending structured WebSocket events.
+
+Node updates and streamed commentary chunks are coalesced into short batches
+(see `coalescer`); complete commentary and errors are sent immediately.
 """
-from app.api.websockets.connection_manager import connection_manager
+from app.api.websockets.coalescer import broadcast_coalescer
+from app.api.websockets.encoding import encode_commentary, encode_error
 from app.models.agent_node import AgentNode
-from app.models.events import NodeEvent, CommentaryEvent, ErrorEvent
 from app.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
 
 async def broadcast_node_update(workflow_id: str, node: AgentNode):
-    event = NodeEvent(payload=node)
-    await connection_manager.broadcast_to_workflow(workflow_id, event.dict())
+    broadcast_coalescer.enqueue(workflow_id, node)
+
+
+async def broadcast_node_batch(workflow_id: str, nodes: list[AgentNode]):
+    for node in nodes:
+        broadcast_coalescer.enqueue(workflow_id, node)
 
 
 async def broadcast_commentary(workflow_id: str, commentary: dict):
-    event = CommentaryEvent(payload=commentary)
-    await connection_manager.broadcast_to_workflow(workflow_id, event.dict())
+    await broadcast_coalescer.send_now(workflow_id, encode_commentary(commentary))
+
+
+async def broadcast_commentary_chunk(workflow_id: str, title: str, chunk: str):
+    broadcast_coalescer.enqueue_text(workflow_id, title, chunk)
 
 
 async def broadcast_error(workflow_id: str, error_details: dict):
-    event = ErrorEvent(payload=error_details)
-    await connection_manager.broadcast_to_workflow(workflow_id, event.dict())
+    await broadcast_coalescer.send_now(workflow_id, encode_error(error_details))
@@ -0,0 +1,118 @@
+"""Coalescing of node updates and streamed text into batched WebSocket messages.
+
+A tool node typically goes WAITING -> PROCESSING -> COMPLETED within a few
+milliseconds of its siblings. Rather than sending one frame per transition, node
+updates are buffered per workflow for a short window and flushed as a single
+`NodeBatchEvent`. Only the latest state of each node is sent, since the buffered
+`AgentNode` objects are serialized at flush time. Once `max_batch` distinct nodes
+are buffered for a workflow, the batch is flushed without waiting for the window
+to end, which bounds both latency and frame size.
+
+Streamed text (e.g. LLM tokens) is buffered the same way and flushed as one
+commentary event with severity "stream" per window.
+
+Events that must not be delayed (commentary, errors, final answers) go through
+`send_now`, which flushes any buffered node updates first so clients still see
+events in order.
+"""
+from __future__ import annotations
+
+import asyncio
+from typing import Dict, List, Set
+
+from app.api.websockets.connection_manager import connection_manager
+from app.core.config import get_settings
+from app.models.agent_node import AgentNode
+from app.api.websockets.encoding import (
+    encode_commentary,
+    encode_node_batch,
+    encode_node_event,
+)
+from app.utils.logging import get_logger
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+
+class BroadcastCoalescer:
+    """Buffers node updates and streamed text per workflow, flushing after a short delay."""
+
+    def __init__(self, delay: float, max_batch: int) -> None:
+        self.delay = delay
+        self.max_batch = max_batch
+        # workflow_id -> node_id -> node, in first-enqueued order
+        self._pending: Dict[str, Dict[str, AgentNode]] = {}
+        # workflow_id -> commentary title -> streamed text chunks
+        self._pending_text: Dict[str, Dict[str, List[str]]] = {}
+        self._timers: Dict[str, asyncio.TimerHandle] = {}
+        self._flush_tasks: Set[asyncio.Task] = set()
+
+    def enqueue(self, workflow_id: str, node: AgentNode) -> None:
+        """Buffer a node update, scheduling a flush if none is pending."""
+
+        pending = self._pending.setdefault(workflow_id, {})
+        pending[node.id] = node
+        if len(pending) >= self.max_batch:
+            # Any armed timer stays in place for buffered streamed text.
+            self._flush_nodes(workflow_id)
+        else:
+            self._arm_timer(workflow_id)
+
+    def enqueue_text(self, workflow_id: str, title: str, chunk: str) -> None:
+        """Buffer a chunk of streamed commentary text."""
+
+        self._pending_text.setdefault(workflow_id, {}).setdefault(title, []).append(chunk)
+        self._arm_timer(workflow_id)
+
+    def _arm_timer(self, workflow_id: str) -> None:
+        if workflow_id not in self._timers:
+            loop = asyncio.get_running_loop()
+            self._timers[workflow_id] = loop.call_later(
+                self.delay, self._schedule_flush, workflow_id
+            )
+
+    def _schedule_flush(self, workflow_id: str) -> None:
+        self._timers.pop(workflow_id, None)
+        task = asyncio.create_task(self.flush(workflow_id))
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def flush(self, workflow_id: str) -> None:
+        """Send all buffered updates for a workflow immediately."""
+
+        timer = self._timers.pop(workflow_id, None)
+        if timer is not None:
+            timer.cancel()
+
+        self._flush_nodes(workflow_id)
+
+        pending_text = self._pending_text.pop(workflow_id, None)
+        for title, chunks in (pending_text or {}).items():
+            payload = encode_commentary(
+                {"title": title, "content": "".join(chunks), "severity": "stream"}
+            )
+            connection_manager.queue_broadcast(workflow_id, payload)
+
+    def _flush_nodes(self, workflow_id: str) -> None:
+        """Send the buffered node updates for a workflow as one message."""
+
+        pending = self._pending.pop(workflow_id, None)
+        if not pending:
+            return
+        nodes: List[AgentNode] = list(pending.values())
+        payload = encode_node_event(nodes[0]) if len(nodes) == 1 else encode_node_batch(nodes)
+        connection_manager.queue_broadcast(workflow_id, payload)
+        logger.debug("Flushed %d node updates for workflow %s", len(nodes), workflow_id)
+
+    async def send_now(self, workflow_id: str, payload: str) -> None:
+        """Send a serialized event without delay, after any buffered updates."""
+
+        await self.flush(workflow_id)
+        connection_manager.queue_broadcast(workflow_id, payload)
+
+
+# Global singleton instance
+broadcast_coalescer = BroadcastCoalescer(
+    delay=settings.BROADCAST_COALESCE_WINDOW_MS / 1000,
+    max_batch=settings.BROADCAST_MAX_BATCH_SIZE,
+)
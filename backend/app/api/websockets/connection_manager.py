@@ -2,34 +2,63 @@
 
 This module provides a thread-safe manager to handle the lifecycle of
 WebSocket connections, associating them with specific workflow sessions.
+
+Each connection gets a bounded outbound queue drained by its own sender task.
+Sending never waits on a client: when a slow client's queue is full, its oldest
+queued message is dropped, so one stalled browser tab cannot hold up delivery to
+other subscribers or accumulate unbounded memory.
 """
 from __future__ import annotations
 
 import asyncio
-from typing import Dict
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, Optional, Set
 
+import orjson
 from fastapi import WebSocket
 
+from app.core.config import get_settings
 from app.utils.logging import get_logger
 
 logger = get_logger(__name__)
+settings = get_settings()
+
+
+@dataclass(slots=True)
+class ConnectionEntry:
+    """Everything the manager tracks for one connected session."""
+
+    ws: WebSocket
+    workflow_id: str
+    queue: asyncio.Queue[str]
+    sender: Optional[asyncio.Task] = None
 
 
 class ConnectionManager:
     """Manages active WebSocket connections."""
 
     def __init__(self) -> None:
-        # Maps session_id -> WebSocket
-        self.active_connections: Dict[str, WebSocket] = {}
-        # Maps session_id -> workflow_id
-        self.session_to_workflow: Dict[str, str] = {}
+        # Maps session_id -> connection state
+        self.connections: Dict[str, ConnectionEntry] = {}
+        # Reverse index: workflow_id -> subscribed session_ids
+        self.workflow_to_sessions: Dict[str, Set[str]] = defaultdict(set)
+        # Messages discarded because a client could not keep up
+        self.dropped_messages = 0
 
     async def connect(self, websocket: WebSocket, session_id: str, workflow_id: str) -> None:
         """Accept a new WebSocket and register it with the manager."""
 
         await websocket.accept()
-        self.active_connections[session_id] = websocket
-        self.session_to_workflow[session_id] = workflow_id
+        self._remove(session_id)
+        entry = ConnectionEntry(
+            ws=websocket,
+            workflow_id=workflow_id,
+            queue=asyncio.Queue(maxsize=settings.WS_OUTBOUND_QUEUE_SIZE),
+        )
+        entry.sender = asyncio.create_task(self._sender(session_id, entry))
+        self.connections[session_id] = entry
+        self.workflow_to_sessions[workflow_id].add(session_id)
         logger.info(
             "WebSocket connected: session_id=%s, workflow_id=%s", session_id, workflow_id
         )
@@ -37,47 +66,90 @@ class ConnectionManager:
     def disconnect(self, session_id: str) -> None:
         """Remove a WebSocket connection from the active pool."""
 
-        if session_id in self.active_connections:
-            del self.active_connections[session_id]
-            self.session_to_workflow.pop(session_id, None)
+        if self._remove(session_id) is not None:
             logger.info("WebSocket disconnected: session_id=%s", session_id)
 
-    async def send_personal_message(self, message: dict, session_id: str) -> None:
-        """Send a JSON message to a specific WebSocket connection."""
+    def _remove(self, session_id: str) -> Optional[ConnectionEntry]:
+        """Unregister a session, unsubscribe it and cancel its sender task."""
 
-        websocket = self.active_connections.get(session_id)
-        if not websocket:
-            logger.warning("Attempted to send message to inactive session: %s", session_id)
-            return
+        entry = self.connections.pop(session_id, None)
+        if entry is None:
+            return None
+        self._unsubscribe(session_id, entry.workflow_id)
+        if entry.sender is not None and entry.sender is not asyncio.current_task():
+            entry.sender.cancel()
+        return entry
+
+    async def _sender(self, session_id: str, entry: ConnectionEntry) -> None:
+        """Forward queued messages to a single WebSocket until it fails."""
 
         try:
-            await websocket.send_json(message)
-            logger.debug("Sent message to session %s: %s", session_id, message.get("type"))
+            while True:
+                payload = await entry.queue.get()
+                await entry.ws.send_text(payload)
+        except asyncio.CancelledError:
+            raise
         except Exception as exc:  # noqa: BLE001
             logger.error(
                 "Failed to send message to session %s: %s", session_id, exc, exc_info=True
             )
-            self.disconnect(session_id)
+            if self.connections.get(session_id) is entry:
+                self.disconnect(session_id)
+
+    def _unsubscribe(self, session_id: str, workflow_id: str) -> None:
+        """Drop a session from its workflow's subscriber set."""
+
+        sessions = self.workflow_to_sessions.get(workflow_id)
+        if sessions is not None:
+            sessions.discard(session_id)
+            if not sessions:
+                del self.workflow_to_sessions[workflow_id]
+
+    async def send_personal_message(self, message: dict, session_id: str) -> None:
+        """Send a JSON message to a specific WebSocket connection."""
+
+        self._enqueue(orjson.dumps(message).decode(), session_id)
+
+    def _enqueue(self, payload: str, session_id: str) -> None:
+        """Queue a message for a session without waiting on the client.
 
-    async def broadcast_to_workflow(self, workflow_id: str, message: dict) -> None:
-        """Broadcast a message to all sessions subscribed to a workflow."""
+        If the session's queue is full, the oldest queued message is dropped to
+        make room.
+        """
+
+        entry = self.connections.get(session_id)
+        if entry is None:
+            logger.warning("Attempted to send message to inactive session: %s", session_id)
+            return
 
-        session_ids = [
-            sid for sid, wid in self.session_to_workflow.items() if wid == workflow_id
-        ]
+        queue = entry.queue
+        try:
+            queue.put_nowait(payload)
+        except asyncio.QueueFull:
+            queue.get_nowait()
+            queue.put_nowait(payload)
+            self.dropped_messages += 1
+            logger.debug("Outbound queue full for session %s; dropped oldest message", session_id)
+
+    def queue_broadcast(self, workflow_id: str, payload: str) -> None:
+        """Queue an already-serialized JSON message for every session of a workflow.
+
+        The payload is encoded once by the caller and queued verbatim for every
+        subscriber; queueing never waits on a client.
+        """
+
+        session_ids = list(self.workflow_to_sessions.get(workflow_id, ()))
         if not session_ids:
             logger.warning(
                 "No active WebSocket sessions found for workflow_id: %s", workflow_id
             )
             return
 
-        await asyncio.gather(
-            *(self.send_personal_message(message, sid) for sid in session_ids)
-        )
+        for sid in session_ids:
+            self._enqueue(payload, sid)
         logger.info(
             "Broadcast message to %d sessions for workflow %s", len(session_ids), workflow_id
         )
 
-
 # Global singleton instance
 connection_manager = ConnectionManager()
@@ -0,0 +1,53 @@
+"""JSON encoding of outbound WebSocket events.
+
+Every event shares the envelope ``{"type": ..., "payload": ...}`` and only the
+payload varies. The envelope prefix for each event type is therefore built once,
+and per event only the payload is serialized and spliced in, skipping the
+construction and validation of a wrapper event model.
+
+The output is identical to ``Event(payload=...).model_dump_json()``.
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, Type
+
+import orjson
+from pydantic import BaseModel
+
+from app.models.agent_node import AgentNode
+from app.models.events import CommentaryEvent, ErrorEvent, NodeBatchEvent, NodeEvent
+
+
+def _envelope_prefix(event_model: Type[BaseModel]) -> str:
+    event_type = event_model.model_fields["type"].default
+    return '{"type":' + orjson.dumps(event_type).decode() + ',"payload":'
+
+
+_NODE_PREFIX = _envelope_prefix(NodeEvent)
+_NODE_BATCH_PREFIX = _envelope_prefix(NodeBatchEvent)
+_COMMENTARY_PREFIX = _envelope_prefix(CommentaryEvent)
+_ERROR_PREFIX = _envelope_prefix(ErrorEvent)
+
+
+def encode_node_event(node: AgentNode) -> str:
+    """Encode a `NodeEvent` for a single node."""
+
+    return _NODE_PREFIX + node.model_dump_json() + "}"
+
+
+def encode_node_batch(nodes: Iterable[AgentNode]) -> str:
+    """Encode a `NodeBatchEvent` for several nodes."""
+
+    return _NODE_BATCH_PREFIX + "[" + ",".join(node.model_dump_json() for node in nodes) + "]}"
+
+
+def encode_commentary(commentary: Dict[str, Any]) -> str:
+    """Encode a `CommentaryEvent`."""
+
+    return _COMMENTARY_PREFIX + orjson.dumps(commentary).decode() + "}"
+
+
+def encode_error(error_details: Dict[str, Any]) -> str:
+    """Encode an `ErrorEvent`."""
+
+    return _ERROR_PREFIX + orjson.dumps(error_details).decode() + "}"
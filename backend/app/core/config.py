@@ -4,62 +4,126 @@ Handles all environment variables and application settings using Pydantic
 for robust validation and type-checking.
 """
 
+import os
 import secrets
+import tempfile
 from functools import lru_cache
-from typing import List, Any
+from typing import Annotated, Any, List, Optional
 
-# Pydantic v2 moved BaseSettings to a separate package.
-# Attempt to import from the new location first for forward compatibility.
-# Fallback to pydantic import for older (<2.0) versions to keep backward compatibility.
-try:
-    from pydantic_settings import BaseSettings  # type: ignore
-except ModuleNotFoundError:  # pragma: no cover
-    from pydantic import BaseSettings  # type: ignore
-
-from pydantic import Field, validator
+from pydantic import Field, field_validator
+from pydantic_settings import BaseSettings, NoDecode, SettingsConfigDict
 
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables and .env files."""
 
     # --- Core Application Settings ---
-    APP_NAME: str = Field(default="Agentic SRE", env="APP_NAME")
-    APP_VERSION: str = Field(default="1.0.0", env="APP_VERSION")
-    DEBUG: bool = Field(default=False, env="DEBUG")
+    APP_NAME: str = Field(default="Agentic SRE")
+    APP_VERSION: str = Field(default="1.0.0")
+    DEBUG: bool = Field(default=False)
     ENVIRONMENT: str = Field(
         default="development",
-        env="ENVIRONMENT",
         description="Must be 'development', 'staging', or 'production'",
     )
 
     # --- API & Security Settings ---
-    API_V1_PREFIX: str = Field(default="/api/v1", env="API_V1_PREFIX")
-    SECRET_KEY: str = Field(default_factory=lambda: secrets.token_urlsafe(32), env="SECRET_KEY")
+    API_V1_PREFIX: str = Field(default="/api/v1")
+    SECRET_KEY: str = Field(default_factory=lambda: secrets.token_urlsafe(32))
 
     # --- CORS (Cross-Origin Resource Sharing) Settings ---
-    CORS_ORIGINS: str = Field(
-        default="http://localhost:3000,http://localhost:5173", env="CORS_ORIGINS"
+    # Given as a comma-separated string in the environment; parsed once into a list.
+    # NoDecode stops pydantic-settings from expecting a JSON array instead.
+    CORS_ORIGINS: Annotated[List[str], NoDecode] = Field(
+        default=["http://localhost:3000", "http://localhost:5173"]
     )
+    # Optional pattern for origins that cannot be listed up front (e.g. preview deploys).
+    CORS_ORIGIN_REGEX: Optional[str] = Field(default=None)
 
     # --- Gemini AI Settings ---
-    GEMINI_API_KEY: str = Field(..., env="GEMINI_API_KEY", description="Your Google Gemini API Key is required.")
-    GEMINI_MODEL: str = Field(default="gemini-1.5-flash", env="GEMINI_MODEL")
+    GEMINI_API_KEY: str = Field(..., description="Your Google Gemini API Key is required.")
+    GEMINI_MODEL: str = Field(default="gemini-1.5-flash")
+    GEMINI_PLANNER_TEMPERATURE: float = Field(
+        default=0.0,
+        description="Sampling temperature for planning calls; plans are only cached when this is 0.",
+    )
+    GEMINI_SYNTHESIS_TEMPERATURE: Optional[float] = Field(
+        default=None,
+        description=(
+            "Sampling temperature for the final answer. Unset keeps the model's default;"
+            " answers are only cached when this is explicitly 0."
+        ),
+    )
+    GEMINI_WARMUP_ON_STARTUP: bool = Field(
+        default=True,
+        description="Open the Gemini connection at startup so the first request does not pay for it.",
+    )
+
+    # --- LLM Response Cache Settings ---
+    LLM_CACHE_BACKEND: str = Field(default="memory", description="Must be 'memory' or 'redis'")
+    LLM_CACHE_TTL_SECONDS: int = Field(default=3600)
+    LLM_CACHE_MAX_ENTRIES: int = Field(
+        default=1024,
+        description="Entries kept by in-process caches before the least recently used is evicted.",
+    )
+    REDIS_URL: str = Field(default="redis://localhost:6379/0")
 
     # --- Data Collector Service Settings ---
-    DATA_COLLECTOR_URL: str = Field(
-        ..., env="DATA_COLLECTOR_URL", description="URL for the internal Data Collector service."
+    DATA_COLLECTOR_URL: str = Field(..., description="URL for the internal Data Collector service.")
+
+    TOOL_EXECUTOR_URL: str = Field(..., description="URL for the internal Tool Executor service.")
+
+    MOCK_TOOL_LATENCY_S: float = Field(
+        default=0.0,
+        description="Simulated latency of each mock tool call, in seconds.",
+    )
+
+    # --- WebSocket Settings ---
+    BROADCAST_COALESCE_WINDOW_MS: int = Field(
+        default=20,
+        description="How long node updates are buffered before being sent as one batch.",
+    )
+
+    BROADCAST_MAX_BATCH_SIZE: int = Field(
+        default=16,
+        description="Buffered node updates that trigger a flush before the window ends.",
     )
 
-    TOOL_EXECUTOR_URL: str = Field(
-        ..., env="TOOL_EXECUTOR_URL", description="URL for the internal Tool Executor service."
+    WS_OUTBOUND_QUEUE_SIZE: int = Field(
+        default=128,
+        description="Messages buffered per client before the oldest are dropped.",
     )
 
+    # --- Plan Cache Settings ---
+    PLAN_CACHE_ENABLED: bool = Field(default=False)
+    PLAN_CACHE_THRESHOLD: float = Field(
+        default=0.95,
+        description="Minimum cosine similarity for a cached plan to be reused.",
+    )
+    PLAN_CACHE_PATH: str = Field(
+        default=os.path.join(tempfile.gettempdir(), "agentic_sre_plan_cache.sqlite3"),
+        description="SQLite file for cached plans; kept out of the source tree by default.",
+    )
+    PLAN_CACHE_MAX_ENTRIES: int = Field(
+        default=10_000,
+        description="Cached plans kept before the least recently used is evicted.",
+    )
+    PLAN_CACHE_EMBEDDING_MODEL: str = Field(default="models/text-embedding-004")
+
     # --- Logging Settings ---
-    LOG_LEVEL: str = Field(default="INFO", env="LOG_LEVEL")
+    LOG_LEVEL: str = Field(default="INFO")
 
     # --- Validator Methods ---
-    @validator("LOG_LEVEL")
-    def validate_log_level(cls, v: str) -> str:  # noqa: N805
+    @field_validator("CORS_ORIGINS", mode="before")
+    @classmethod
+    def split_cors_origins(cls, v: Any) -> Any:
+        """Split a comma-separated origins string into a list."""
+        if isinstance(v, str):
+            return [origin.strip() for origin in v.split(",") if origin.strip()]
+        return v
+
+    @field_validator("LOG_LEVEL")
+    @classmethod
+    def validate_log_level(cls, v: str) -> str:
         """Ensure log level is a valid choice."""
         valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
         level = v.upper()
@@ -67,8 +131,9 @@ class Settings(BaseSettings):
             raise ValueError(f"Invalid log level: '{v}'. Must be one of {valid_levels}")
         return level
 
-    @validator("ENVIRONMENT")
-    def validate_environment(cls, v: str) -> str:  # noqa: N805
+    @field_validator("ENVIRONMENT")
+    @classmethod
+    def validate_environment(cls, v: str) -> str:
         """Ensure environment is a valid choice."""
         valid_envs = ["development", "staging", "production"]
         env = v.lower()
@@ -76,13 +141,31 @@ class Settings(BaseSettings):
             raise ValueError(f"Invalid environment: '{v}'. Must be one of {valid_envs}")
         return env
 
-    # --- Configuration Class ---
-    class Config:  # noqa: D106
-        """Pydantic settings configuration."""
-
-        case_sensitive = False
-        env_file = ".env"
-        env_file_encoding = "utf-8"
+    @field_validator("LLM_CACHE_BACKEND")
+    @classmethod
+    def validate_llm_cache_backend(cls, v: str) -> str:
+        """Ensure the LLM cache backend is a valid choice."""
+        valid_backends = ["memory", "redis"]
+        backend = v.lower()
+        if backend not in valid_backends:
+            raise ValueError(f"Invalid LLM cache backend: '{v}'. Must be one of {valid_backends}")
+        return backend
+
+    @field_validator("PLAN_CACHE_THRESHOLD")
+    @classmethod
+    def validate_plan_cache_threshold(cls, v: float) -> float:
+        """Ensure the similarity threshold is a valid cosine score."""
+        if not 0.0 < v <= 1.0:
+            raise ValueError(f"Invalid plan cache threshold: {v}. Must be in (0, 1].")
+        return v
+
+    # --- Settings Configuration ---
+    # Each field is read from the environment variable of the same name.
+    model_config = SettingsConfigDict(
+        case_sensitive=False,
+        env_file=".env",
+        env_file_encoding="utf-8",
+    )
 
 
 @lru_cache()
@@ -4,7 +4,10 @@ This module provides reusable functions for dependency injection,
 such as getting settings, which helps in decoupling components and improving testability.
 """
 
+from fastapi import Request
+
 from app.core.config import Settings, get_settings
+from app.llm.gemini_client import GeminiClient, get_gemini_client
 
 
 # For now, this file is simple. It just re-exports the get_settings function
@@ -15,3 +18,9 @@ from app.core.config import Settings, get_settings
 def get_app_settings() -> Settings:
     """Return cached application settings (FastAPI dependency)."""
     return get_settings()
+
+
+def get_llm_client(request: Request) -> GeminiClient:
+    """Return the Gemini client created at startup (FastAPI dependency)."""
+    client = getattr(request.app.state, "gemini_client", None)
+    return client if client is not None else get_gemini_client(get_settings())
@@ -0,0 +1,172 @@
+"""Exact-match response cache for LLM calls.
+
+Deterministic prompts (temperature 0) always produce equivalent responses, so
+paying for them twice is wasted latency and tokens. `LLMCache` keys responses by
+a hash of the model, prompt, and temperature and stores them in a pluggable
+backend: an in-process dictionary for single-instance deployments, or Redis
+when several backend instances should share one cache.
+"""
+from __future__ import annotations
+
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Protocol, Tuple
+
+from app.core.config import Settings, get_settings
+from app.core.exceptions import ConfigurationError
+from app.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class CacheBackend(Protocol):
+    """Minimal async key-value interface required by `LLMCache`."""
+
+    async def get(self, key: str) -> Optional[str]:  # noqa: D102
+        ...
+
+    async def set(self, key: str, value: str, ttl: Optional[int] = None) -> None:  # noqa: D102
+        ...
+
+    async def delete(self, key: str) -> None:  # noqa: D102
+        ...
+
+    async def clear(self) -> None:  # noqa: D102
+        ...
+
+
+class MemoryCacheBackend:
+    """In-process backend with per-entry expiry and least-recently-used eviction."""
+
+    def __init__(self, max_entries: Optional[int] = None) -> None:
+        self.max_entries = max_entries
+        self._data: "OrderedDict[str, Tuple[Optional[float], Any]]" = OrderedDict()
+
+    async def get(self, key: str) -> Optional[Any]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            self._data.pop(key, None)
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        expires_at = time.monotonic() + ttl if ttl else None
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+        if self.max_entries is not None:
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    async def delete(self, key: str) -> None:
+        self._data.pop(key, None)
+
+    async def clear(self) -> None:
+        self._data.clear()
+
+
+class RedisCacheBackend:
+    """Redis backend so that multiple backend instances share cached responses."""
+
+    def __init__(self, url: str, namespace: str = "llm-cache:") -> None:
+        try:
+            import redis.asyncio as redis  # type: ignore
+        except ModuleNotFoundError as exc:  # pragma: no cover
+            raise ConfigurationError(
+                "LLM_CACHE_BACKEND is 'redis' but the 'redis' package is not installed."
+            ) from exc
+
+        self._client = redis.from_url(url, decode_responses=True)
+        self._namespace = namespace
+
+    async def get(self, key: str) -> Optional[str]:
+        return await self._client.get(self._namespace + key)
+
+    async def set(self, key: str, value: str, ttl: Optional[int] = None) -> None:
+        await self._client.set(self._namespace + key, value, ex=ttl or None)
+
+    async def delete(self, key: str) -> None:
+        await self._client.delete(self._namespace + key)
+
+    async def clear(self) -> None:
+        async for key in self._client.scan_iter(match=self._namespace + "*"):
+            await self._client.delete(key)
+
+
+class LLMCache:
+    """Response cache consulted before every deterministic LLM call."""
+
+    def __init__(self, backend: CacheBackend, ttl_seconds: Optional[int] = None) -> None:
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def cache_key(model: str, prompt: str, temperature: float) -> Optional[str]:
+        """Return the cache key for a call, or None if the call is not cacheable.
+
+        Surrounding whitespace in the prompt is ignored, so trivially different
+        renderings of the same query share an entry.
+        """
+
+        if temperature > 0:
+            return None
+        digest = hashlib.sha256(
+            f"{model}\x00{temperature}\x00{prompt.strip()}".encode()
+        ).hexdigest()
+        return digest
+
+    async def get(self, key: str) -> Optional[str]:
+        """Return a cached response, treating backend failures as a miss."""
+
+        try:
+            value = await self.backend.get(key)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("LLM cache lookup failed: %s", exc)
+            value = None
+
+        if value is None:
+            self.misses += 1
+            logger.info("LLM cache miss (hits=%d, misses=%d)", self.hits, self.misses)
+        else:
+            self.record_hit()
+        return value
+
+    def record_hit(self) -> None:
+        """Count a hit served by a caller-side cache layered on top of this one."""
+
+        self.hits += 1
+        logger.info("LLM cache hit (hits=%d, misses=%d)", self.hits, self.misses)
+
+    async def set(self, key: str, value: str) -> None:
+        """Store a response; failures are logged and otherwise ignored."""
+
+        try:
+            await self.backend.set(key, value, ttl=self.ttl_seconds)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("LLM cache store failed: %s", exc)
+
+    async def delete(self, key: str) -> None:  # noqa: D102
+        await self.backend.delete(key)
+
+    async def clear(self) -> None:  # noqa: D102
+        await self.backend.clear()
+
+
+def build_llm_cache(settings: Settings) -> LLMCache:
+    """Create the LLM cache for the configured backend."""
+
+    if settings.LLM_CACHE_BACKEND == "redis":
+        backend: CacheBackend = RedisCacheBackend(settings.REDIS_URL)
+    else:
+        backend = MemoryCacheBackend(max_entries=settings.LLM_CACHE_MAX_ENTRIES)
+    return LLMCache(backend, ttl_seconds=settings.LLM_CACHE_TTL_SECONDS)
+
+
+# Global singleton instance shared by all Gemini clients
+llm_cache = build_llm_cache(get_settings())
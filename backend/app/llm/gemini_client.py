@@ -5,17 +5,34 @@ providing a clean, error-handled interface for the rest of the application.
 
 from __future__ import annotations
 
-import json
-from typing import Any, Dict
+import asyncio
+import copy
+import re
+import weakref
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 import google.generativeai as genai
+import orjson
 
 from app.core.config import Settings
 from app.core.exceptions import LLMConnectionError, LLMResponseError
+from app.llm.cache import MemoryCacheBackend, llm_cache
 from app.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Matches a markdown code fence (```json, ```JSON or bare ```) and captures its body.
+_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)\s*```", re.DOTALL | re.IGNORECASE)
+
+
+def _strip_fences(text: str) -> str:
+    """Return the JSON body of an LLM response, without any markdown fences."""
+
+    if text.startswith("{"):
+        return text
+    match = _FENCE_RE.search(text)
+    return match.group(1) if match else text.strip()
+
 
 class GeminiClient:
     """Client for interacting with the Google Gemini API."""
@@ -24,8 +41,13 @@ class GeminiClient:
         """Initialize the Gemini client with application settings."""
 
         self.settings = settings
+        self.cache = llm_cache
+        # Parsed plans by cache key, so repeated queries skip both the API call
+        # and re-parsing the cached response text.
+        self._plans = MemoryCacheBackend(max_entries=self.settings.LLM_CACHE_MAX_ENTRIES)
         try:
             genai.configure(api_key=self.settings.GEMINI_API_KEY)
+            # Sampling is set per call, so each kind of call keeps its own temperature.
             self.model = genai.GenerativeModel(model_name=self.settings.GEMINI_MODEL)
             logger.info(
                 "Gemini client initialized successfully for model: %s",
@@ -35,30 +57,82 @@ class GeminiClient:
             logger.error("Failed to configure Gemini client: %s", exc, exc_info=True)
             raise LLMConnectionError(service="Gemini", reason=str(exc)) from exc
 
+    async def warm_up(self) -> None:
+        """Make a cheap API call so imports, auth and the channel are set up ahead of use.
+
+        `count_tokens` exercises the same async transport as generation without
+        spending any tokens.
+        """
+
+        await self.model.count_tokens_async("ping")
+        logger.info("Gemini client warmed up.")
+
+    def _cache_key(self, prompt: str, temperature: Optional[float]) -> Optional[str]:
+        """Return the cache key for a call, or None if it is not cacheable.
+
+        Calls without an explicit temperature sample with the model's default
+        and are never cached.
+        """
+
+        if temperature is None:
+            return None
+        return self.cache.cache_key(self.settings.GEMINI_MODEL, prompt, temperature)
+
+    async def _cached_response(
+        self, prompt: str, temperature: Optional[float]
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """Return ``(cache_key, cached_text)`` for a prompt; either may be None."""
+
+        key = self._cache_key(prompt, temperature)
+        if key is None:
+            return None, None
+        return key, await self.cache.get(key)
+
     async def generate_plan(self, prompt: str) -> Dict[str, Any]:
         """Generate an execution plan using the provided prompt."""
 
         logger.info("Generating execution plan from LLM…")
+        temperature = self.settings.GEMINI_PLANNER_TEMPERATURE
+        cache_key = self._cache_key(prompt, temperature)
+        if cache_key:
+            cached_plan = await self._plans.get(cache_key)
+            if cached_plan is not None:
+                # Still a response-cache hit, just one that skips re-parsing.
+                self.cache.record_hit()
+                return copy.deepcopy(cached_plan)
+
+        raw_text = await self.cache.get(cache_key) if cache_key else None
+        from_cache = raw_text is not None
         try:
-            response = await self.model.generate_content_async(contents=prompt)
+            if not from_cache:
+                response = await self.model.generate_content_async(
+                    contents=prompt, generation_config={"temperature": temperature}
+                )
+                raw_text = response.text.strip()
 
             # The response may include markdown fences; strip them before parsing.
-            raw_text = response.text.strip()
-            json_text = raw_text.replace("```json", "").replace("```", "").strip()
+            json_text = _strip_fences(raw_text)
 
             if not json_text:
                 raise LLMResponseError("LLM returned an empty response for the plan.")
 
-            plan: Dict[str, Any] = json.loads(json_text)
+            plan: Dict[str, Any] = orjson.loads(json_text)
             logger.info(
                 "Successfully generated and parsed execution plan with %d nodes.",
                 len(plan.get("nodes", [])),
             )
+            # Only cache responses that parsed, so a bad answer is retried next time.
+            if cache_key:
+                if not from_cache:
+                    await self.cache.set(cache_key, raw_text)
+                await self._plans.set(
+                    cache_key, copy.deepcopy(plan), ttl=self.settings.LLM_CACHE_TTL_SECONDS
+                )
             return plan
 
-        except json.JSONDecodeError as exc:
+        except orjson.JSONDecodeError as exc:
             logger.error(
-                "Failed to decode JSON from LLM response. Raw text: '%s'", raw_text, exc_info=True
+                "Failed to decode JSON from LLM response (%s). Raw text: '%s'", exc, raw_text
             )
             raise LLMResponseError(f"LLM response was not valid JSON: {exc}") from exc
         except LLMResponseError:
@@ -68,3 +142,60 @@ class GeminiClient:
                 "An unexpected error occurred during plan generation: %s", exc, exc_info=True
             )
             raise LLMConnectionError(service="Gemini", reason=str(exc)) from exc
+
+    async def generate_synthesis_stream(self, prompt: str) -> AsyncIterator[str]:
+        """Yield the final answer in chunks as Gemini generates it."""
+
+        logger.info("Streaming final synthesis from LLM…")
+        temperature = self.settings.GEMINI_SYNTHESIS_TEMPERATURE
+        cache_key, text = await self._cached_response(prompt, temperature)
+        if text is not None:
+            yield text
+            return
+
+        chunks: List[str] = []
+        try:
+            response = await self.model.generate_content_async(
+                contents=prompt,
+                generation_config=None if temperature is None else {"temperature": temperature},
+                stream=True,
+            )
+            async for chunk in response:
+                if chunk.text:
+                    chunks.append(chunk.text)
+                    yield chunk.text
+        except Exception as exc:  # noqa: BLE001
+            logger.error(
+                "An unexpected error occurred during synthesis streaming: %s", exc, exc_info=True
+            )
+            raise LLMConnectionError(service="Gemini", reason=str(exc)) from exc
+
+        text = "".join(chunks).strip()
+        if not text:
+            raise LLMResponseError("LLM returned an empty response for the synthesis.")
+
+        if cache_key:
+            await self.cache.set(cache_key, text)
+
+
+# The SDK's async transport is bound to the event loop it was created on, so
+# clients are shared per loop; reusing one keeps its connection warm across
+# workflows instead of reconfiguring the SDK for every orchestrator.
+_client_by_loop: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, GeminiClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_gemini_client(settings: Settings) -> GeminiClient:
+    """Return the shared `GeminiClient` for the running event loop."""
+
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return GeminiClient(settings)
+
+    client = _client_by_loop.get(loop)
+    if client is None:
+        client = GeminiClient(settings)
+        _client_by_loop[loop] = client
+    return client
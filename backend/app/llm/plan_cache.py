@@ -0,0 +1,171 @@
+"""Semantic plan cache for the Agentic SRE planner.
+
+Successful execution plans are stored together with an embedding of the query
+that produced them. When a new query is semantically close enough to a cached
+one, the stored plan is reused instead of asking the LLM to plan from scratch.
+
+Entries are persisted in SQLite so they survive restarts; similarity search is a
+brute-force cosine scan over the in-memory vectors, which is plenty for the
+number of distinct plans a single deployment accumulates. The cache is capped at
+`max_entries`; beyond that the least recently used plan is evicted.
+"""
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import copy
+import math
+import operator
+import sqlite3
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+import google.generativeai as genai
+import orjson
+
+from app.core.config import get_settings
+from app.utils.logging import get_logger
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+# Keys of a plan node that describe *what* to do; anything else the planner or
+# the runtime attached is dropped before the plan is cached.
+_PLAN_NODE_KEYS = ("id", "label", "type", "data", "depends_on")
+
+
+def _normalize(vector: List[float]) -> List[float]:
+    norm = math.sqrt(sum(x * x for x in vector))
+    if not norm:
+        return vector
+    return [x / norm for x in vector]
+
+
+def _strip_plan(plan: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a copy of ``plan`` reduced to its reusable, run-independent shape."""
+
+    nodes = [
+        {key: node[key] for key in _PLAN_NODE_KEYS if key in node}
+        for node in plan.get("nodes", [])
+    ]
+    return {"nodes": nodes, "edges": list(plan.get("edges", []))}
+
+
+class PlanCache:
+    """Embedding-keyed cache of previously successful execution plans."""
+
+    def __init__(
+        self, db_path: str, threshold: float, embedding_model: str, max_entries: int
+    ) -> None:
+        self.db_path = db_path
+        self.threshold = threshold
+        self.embedding_model = embedding_model
+        self.max_entries = max_entries
+        # row id -> (embedding, plan), least recently used first
+        self._entries: "OrderedDict[int, Tuple[List[float], Dict[str, Any]]]" = OrderedDict()
+        self._loaded = False
+        self._load_lock = asyncio.Lock()
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+    def _connect(self) -> sqlite3.Connection:
+        # Callers wrap this in `contextlib.closing`: a connection used as a
+        # context manager only commits or rolls back, it is not closed.
+        conn = sqlite3.connect(self.db_path)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS plan_cache ("
+            " id INTEGER PRIMARY KEY AUTOINCREMENT,"
+            " query TEXT NOT NULL,"
+            " embedding TEXT NOT NULL,"
+            " plan TEXT NOT NULL)"
+        )
+        return conn
+
+    def _read_all(self) -> "OrderedDict[int, Tuple[List[float], Dict[str, Any]]]":
+        with contextlib.closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT id, embedding, plan FROM plan_cache ORDER BY id"
+            ).fetchall()
+        return OrderedDict(
+            (row_id, (orjson.loads(embedding), orjson.loads(plan)))
+            for row_id, embedding, plan in rows
+        )
+
+    def _write(self, query: str, embedding: List[float], plan: Dict[str, Any]) -> int:
+        with contextlib.closing(self._connect()) as conn, conn:
+            cursor = conn.execute(
+                "INSERT INTO plan_cache (query, embedding, plan) VALUES (?, ?, ?)",
+                (query, orjson.dumps(embedding).decode(), orjson.dumps(plan).decode()),
+            )
+            return cursor.lastrowid
+
+    def _delete(self, row_ids: List[int]) -> None:
+        with contextlib.closing(self._connect()) as conn, conn:
+            conn.executemany("DELETE FROM plan_cache WHERE id = ?", [(i,) for i in row_ids])
+
+    async def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        async with self._load_lock:
+            if self._loaded:
+                return
+            self._entries = await asyncio.to_thread(self._read_all)
+            self._loaded = True
+            logger.info("Loaded %d cached plans from %s", len(self._entries), self.db_path)
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+    async def embed(self, query: str) -> List[float]:
+        """Embed ``query`` with the configured Gemini embedding model."""
+
+        result = await genai.embed_content_async(
+            model=self.embedding_model, content=query, task_type="semantic_similarity"
+        )
+        return _normalize(list(result["embedding"]))
+
+    async def lookup(self, embedding: List[float]) -> Optional[Dict[str, Any]]:
+        """Return the closest cached plan if it clears the similarity threshold."""
+
+        await self._ensure_loaded()
+
+        best_score, best_id = 0.0, None
+        for row_id, (cached_embedding, _) in self._entries.items():
+            score = sum(map(operator.mul, embedding, cached_embedding))
+            if score > best_score:
+                best_score, best_id = score, row_id
+
+        if best_id is None or best_score < self.threshold:
+            logger.info("Plan cache miss (best similarity %.3f)", best_score)
+            return None
+
+        logger.info("Plan cache hit (similarity %.3f)", best_score)
+        self._entries.move_to_end(best_id)
+        return copy.deepcopy(self._entries[best_id][1])
+
+    async def store(self, query: str, embedding: List[float], plan: Dict[str, Any]) -> None:
+        """Persist a successful plan for future reuse."""
+
+        await self._ensure_loaded()
+
+        stripped = _strip_plan(plan)
+        row_id = await asyncio.to_thread(self._write, query, embedding, stripped)
+        self._entries[row_id] = (embedding, stripped)
+        logger.info("Cached plan with %d nodes for reuse", len(stripped["nodes"]))
+
+        evicted: List[int] = []
+        while len(self._entries) > self.max_entries:
+            evicted.append(self._entries.popitem(last=False)[0])
+        if evicted:
+            await asyncio.to_thread(self._delete, evicted)
+            logger.info("Evicted %d least recently used plans", len(evicted))
+
+
+# Global singleton instance
+plan_cache = PlanCache(
+    db_path=settings.PLAN_CACHE_PATH,
+    threshold=settings.PLAN_CACHE_THRESHOLD,
+    embedding_model=settings.PLAN_CACHE_EMBEDDING_MODEL,
+    max_entries=settings.PLAN_CACHE_MAX_ENTRIES,
+)
@@ -2,11 +2,16 @@
 Prompt templates for interacting with the Gemini LLM.
 Provides structured, reusable prompts for the core agent tasks: planning and synthesis.
 """
+import orjson
 
 # This is the master prompt for the planning phase. It instructs the LLM to act as an SRE
 # and to respond with a structured JSON object representing the execution plan.
 # This level of detail is crucial for getting reliable, parsable output from the LLM.
-PLANNER_PROMPT_TEMPLATE = """
+#
+# Everything that varies per request is kept at the very end of each prompt, so the
+# static instructions form a byte-identical prefix across calls and can be served
+# from Gemini's prompt-prefix cache. Do not interpolate anything into the prefixes.
+PLANNER_PREFIX = """
 You are a helpful and intelligent assistant. Your goal is to answer the user's query.
 
 Analyze the user's query. You have two options:
@@ -27,6 +32,7 @@ Analyze the user's query. You have two options:
       - "description": A clear description of the step.
       - "tool_name": The specific tool to use (e.g., 'metrics_tool', 'logs_tool').
       - "parameters": A dictionary of parameters for the tool.
+    - "depends_on": (Optional) A list of node "id"s that must complete before this step starts.
 
     **Edge Schema:**
     Each edge in the "edges" list defines a dependency:
@@ -36,35 +42,50 @@ Analyze the user's query. You have two options:
     If two nodes can run in parallel, do not create an edge between them.
 
 **User Query:**
-"{user_query}"
+"""
+
+PLANNER_SUFFIX_FMT = """"{user_query}"
 
 Now, generate the JSON execution plan for the user query.
 """
 
+# The suffixes are split around their placeholders once at import time, so
+# building a prompt is a plain concatenation with no format-string parsing.
+_planner_suffix_head, _PLANNER_TAIL = PLANNER_SUFFIX_FMT.split("{user_query}")
+_PLANNER_HEAD = PLANNER_PREFIX + _planner_suffix_head
+
+
 def get_planner_prompt(user_query: str) -> str:
     """Return formatted planner prompt."""
 
-    return PLANNER_PROMPT_TEMPLATE.format(user_query=user_query)
+    return _PLANNER_HEAD + user_query + _PLANNER_TAIL
 
 # --- ADD THIS ENTIRE BLOCK TO THE END OF THE FILE ---
 
 # Prompt for synthesizing a final answer from collected data.
-SYNTHESIZER_PROMPT_TEMPLATE = """
+SYNTHESIZER_PREFIX = """
 You are an expert Site Reliability Engineer (SRE) assistant. Your task is to synthesize a final, comprehensive, and human-readable answer based on a user's query and the data collected from various tools.
 
 Analyze the provided context, which includes the original query and a list of tool execution results.
 Structure your response clearly. Start with a direct, concise answer to the user's question. Then, provide a detailed explanation supported by the evidence from the tool results.
 If applicable, conclude with a list of actionable recommendations.
 
-**Original User Query:**
-{user_query}
+"""
 
-**Collected Data (Tool Results):**
+SYNTHESIZER_SUFFIX_FMT = """**Collected Data (Tool Results):**
 {collected_data}
 
+**Original User Query:**
+{user_query}
+
 **Your Final Synthesized Response:**
 """
 
+_synthesizer_suffix_head, _synthesizer_suffix_rest = SYNTHESIZER_SUFFIX_FMT.split("{collected_data}")
+_SYNTHESIZER_HEAD = SYNTHESIZER_PREFIX + _synthesizer_suffix_head
+_SYNTHESIZER_MIDDLE, _SYNTHESIZER_TAIL = _synthesizer_suffix_rest.split("{user_query}")
+
+
 def get_synthesizer_prompt(user_query: str, collected_data: list) -> str:
     """
     Formats the synthesizer prompt with the query and collected data.
@@ -76,7 +97,8 @@ def get_synthesizer_prompt(user_query: str, collected_data: list) -> str:
     Returns:
         A fully formatted prompt string for the synthesis LLM call.
     """
-    import json
     # Pretty-print the JSON for better readability by the LLM
-    data_str = json.dumps(collected_data, indent=2)
-    return SYNTHESIZER_PROMPT_TEMPLATE.format(user_query=user_query, collected_data=data_str)
+    data_str = orjson.dumps(collected_data, option=orjson.OPT_INDENT_2).decode()
+    return (
+        _SYNTHESIZER_HEAD + data_str + _SYNTHESIZER_MIDDLE + user_query + _SYNTHESIZER_TAIL
+    )
@@ -3,6 +3,9 @@ This file initializes the FastAPI app, sets up middleware,
 defines exception handlers, and includes the API routers.
 """
 
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
@@ -10,6 +13,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
 from app.utils.logging import setup_logging, get_logger
 from app.core.exceptions import AgenticSREException
+from app.llm.gemini_client import get_gemini_client
 
 # Import the new routers we have created
 from app.api.routes import chat as chat_router
@@ -20,6 +24,21 @@ from app.api.websockets import event_handlers as websocket_router
 setup_logging(settings)
 logger = get_logger(__name__)
 
+# --- Application Lifespan ---
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create the shared Gemini client and warm it up before serving requests."""
+
+    app.state.gemini_client = get_gemini_client(settings)
+    if settings.GEMINI_WARMUP_ON_STARTUP:
+        try:
+            await asyncio.wait_for(app.state.gemini_client.warm_up(), timeout=10)
+        except Exception as exc:  # noqa: BLE001
+            # A failed warm-up only means the first request pays the setup cost.
+            logger.warning("Gemini warm-up failed: %r", exc)
+    yield
+
+
 # --- FastAPI App Initialization ---
 app = FastAPI(
     title=settings.APP_NAME,
@@ -27,23 +46,24 @@ app = FastAPI(
     debug=settings.DEBUG,
     docs_url="/docs" if settings.DEBUG else None,
     redoc_url="/redoc" if settings.DEBUG else None,
+    lifespan=lifespan,
 )
 
 # --- Middleware Configuration ---
 # Add CORS middleware to allow requests from our frontend
-if settings.CORS_ORIGINS:
-    # Manually parse the comma-separated string into a list of origins
-    allowed_origins = [origin.strip() for origin in settings.CORS_ORIGINS.split(",") if origin.strip()]
-
+if settings.CORS_ORIGINS or settings.CORS_ORIGIN_REGEX:
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=allowed_origins,  # Use the parsed list
+        allow_origins=settings.CORS_ORIGINS,  # Parsed into a list by Settings
+        allow_origin_regex=settings.CORS_ORIGIN_REGEX,
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
     )
 else:
-    logger.warning("CORS_ORIGINS is not set. No CORS middleware will be applied.")
+    logger.warning(
+        "Neither CORS_ORIGINS nor CORS_ORIGIN_REGEX is set. No CORS middleware will be applied."
+    )
 
 # --- Exception Handlers ---
 @app.exception_handler(AgenticSREException)
@@ -72,7 +92,7 @@ app.include_router(websocket_router.router, tags=["WebSocket"])
 
 # --- Root and Health Check Endpoints ---
 @app.get("/", tags=["Root"])
-async def read_root():
+async def read_root() -> dict[str, str]:
     """A simple root endpoint to confirm the API is running."""
 
     return {
@@ -83,7 +103,7 @@ async def read_root():
 
 
 @app.get("/health", tags=["Health"])
-async def health_check():
+async def health_check() -> dict[str, str]:
     """Health check endpoint for monitoring and load balancers."""
 
     return {"status": "ok"}
@@ -3,12 +3,23 @@ Pydantic models for an Agent Node in the execution graph.
 Defines the structure, states, and metadata associated with each step of a workflow.
 """
 
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+import time
 import uuid
 from enum import Enum
 from typing import Optional, Dict, Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, computed_field, field_serializer
+
+# Wall-clock anchor for monotonic timestamps, taken once at import.
+_EPOCH_WALL = datetime.now(timezone.utc)
+_EPOCH_NS = time.monotonic_ns()
+
+
+def _monotonic_to_datetime(ns: Optional[int]) -> Optional[datetime]:
+    if ns is None:
+        return None
+    return _EPOCH_WALL + timedelta(microseconds=(ns - _EPOCH_NS) // 1000)
 
 
 class NodeType(str, Enum):
@@ -35,9 +46,8 @@ class NodeStatus(str, Enum):
 class NodeData(BaseModel):
     """Represents the data payload of a node, including its inputs, outputs, and metadata."""
 
-    description: Dict[str, Any] = Field(
-        default_factory=dict,
-        description="A dictionary describing the node's purpose and tool metadata.",
+    description: Optional[str] = Field(
+        None, description="A human-readable description of the node's purpose."
     )
     input: Dict[str, Any] = Field(
         default_factory=dict, description="The input data for this node's execution."
@@ -47,8 +57,7 @@ class NodeData(BaseModel):
     )
     error: Optional[str] = Field(None, description="Error message if the node failed.")
 
-    class Config:  # noqa: D106
-        extra = "allow"  # Allows for additional, ad-hoc data fields.
+    model_config = ConfigDict(extra="allow")  # Allows for additional, ad-hoc data fields.
 
 
 class AgentNode(BaseModel):
@@ -69,14 +78,39 @@ class AgentNode(BaseModel):
         None, description="The ID of the parent node in the graph."
     )
 
-    # Timestamps for performance tracking
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    started_at: Optional[datetime] = None
-    completed_at: Optional[datetime] = None
+    # Timestamps for performance tracking. All three are recorded as monotonic
+    # nanoseconds, so durations are an integer subtraction on a single clock;
+    # they are only turned into datetimes when the node is serialized.
+    created_ns: int = Field(default_factory=time.monotonic_ns, exclude=True)
+    started_ns: Optional[int] = Field(None, exclude=True)
+    completed_ns: Optional[int] = Field(None, exclude=True)
 
     # Data payload
     data: NodeData = Field(default_factory=NodeData)
 
-    class Config:  # noqa: D106
-        use_enum_values = True  # Ensures enum members are stored as their string values.
-        json_encoders = {datetime: lambda v: v.isoformat() if v else None}
+    model_config = ConfigDict(
+        use_enum_values=True,  # Ensures enum members are stored as their string values.
+    )
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def created_at(self) -> datetime:
+        """When the node was created."""
+        return _monotonic_to_datetime(self.created_ns)
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def started_at(self) -> Optional[datetime]:
+        """When the node started processing."""
+        return _monotonic_to_datetime(self.started_ns)
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def completed_at(self) -> Optional[datetime]:
+        """When the node completed or failed."""
+        return _monotonic_to_datetime(self.completed_ns)
+
+    @field_serializer("created_at", "started_at", "completed_at", when_used="json")
+    def serialize_datetime(self, v: Optional[datetime]) -> Optional[str]:
+        """Render timestamps as ISO 8601 strings in JSON output."""
+        return v.isoformat() if v else None
@@ -3,7 +3,7 @@ Pydantic models for WebSocket events.
 Defines the precise structure of messages sent from the backend to the frontend
 to ensure type-safe, real-time communication.
 """
-from typing import Literal, Union
+from typing import List, Literal, Union
 
 from pydantic import BaseModel, Field
 
@@ -19,6 +19,15 @@ class NodeEvent(BaseModel):
     )
 
 
+class NodeBatchEvent(BaseModel):
+    """Represents several node creations/updates delivered in a single message."""
+
+    type: Literal["node_batch"] = "node_batch"
+    payload: List[AgentNode] = Field(
+        ..., description="The full state of every node in the batch, in order."
+    )
+
+
 class CommentaryEvent(BaseModel):
     """Represents a new commentary entry event."""
 
@@ -34,4 +43,4 @@ class ErrorEvent(BaseModel):
 
 
 # Union type for any websocket event
-WebSocketEvent = Union[NodeEvent, CommentaryEvent, ErrorEvent]
+WebSocketEvent = Union[NodeEvent, NodeBatchEvent, CommentaryEvent, ErrorEvent]
@@ -2,12 +2,12 @@
 Pydantic models for managing an entire agentic workflow.
 This represents the state of a single user query from start to finish.
 """
-from datetime import datetime
+from datetime import datetime, timezone
 import uuid
 from enum import Enum
-from typing import Dict, Optional
+from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_serializer
 
 from app.models.agent_node import AgentNode
 
@@ -38,12 +38,20 @@ class Workflow(BaseModel):
     node_tree: Dict[str, AgentNode] = Field(
         default_factory=dict, description="Dictionary of all nodes in the workflow keyed by node ID."
     )
+    # Maintained as tool nodes complete, so synthesis need not scan node_tree
+    completed_tool_outputs: List[Dict[str, Any]] = Field(
+        default_factory=list,
+        description="Step label and result of each completed tool node, in completion order.",
+    )
 
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     completed_at: Optional[datetime] = None
 
     error: Optional[str] = Field(None, description="An error message if the entire workflow failed.")
 
-    class Config:  # noqa: D106
-        use_enum_values = True
-        json_encoders = {datetime: lambda v: v.isoformat() if v else None}
+    model_config = ConfigDict(use_enum_values=True)
+
+    @field_serializer("created_at", "completed_at", when_used="json")
+    def serialize_datetime(self, v: Optional[datetime]) -> Optional[str]:
+        """Render timestamps as ISO 8601 strings in JSON output."""
+        return v.isoformat() if v else None
@@ -8,8 +8,10 @@ routes can return immediately while the agent continues processing.
 from __future__ import annotations
 
 import asyncio
+from typing import Optional
 
 from app.agents.orchestrator import AgentOrchestrator
+from app.llm.gemini_client import GeminiClient
 from app.state.workflow_state import workflow_state_manager
 from app.utils.logging import get_logger
 
@@ -17,12 +19,15 @@ logger = get_logger(__name__)
 
 
 class WorkflowService:  # noqa: D101
-    async def start_workflow(self, session_id: str, query: str) -> str:  # noqa: D401
+    async def start_workflow(
+        self, session_id: str, query: str, llm_client: Optional[GeminiClient] = None
+    ) -> str:  # noqa: D401
         """Create and launch a new workflow.
 
         Args:
             session_id: WebSocket session ID for live updates.
             query: The user's natural-language query.
+            llm_client: Gemini client to use; defaults to the shared client.
 
         Returns:
             The unique workflow ID.
@@ -33,7 +38,7 @@ class WorkflowService:  # noqa: D101
         logger.info("Workflow %s created for query: '%s'", workflow.id, query)
 
         # 2. Instantiate orchestrator
-        orchestrator = AgentOrchestrator(workflow_id=workflow.id)
+        orchestrator = AgentOrchestrator(workflow_id=workflow.id, llm_client=llm_client)
 
         # 3. Schedule asynchronous execution
         asyncio.create_task(orchestrator.run())
@@ -1,23 +1,70 @@
 """
 Logging configuration for the Agentic SRE backend.
 Provides structured logging for easy parsing and analysis in production environments.
+
+Records are handed to a queue on the calling thread and formatted and written by
+a background listener thread, so logging never blocks the event loop on JSON
+encoding or stdout writes.
 """
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Optional
 
+import orjson
 from pythonjsonlogger import jsonlogger
 
 from app.core.config import Settings
 
+# Listener draining the log queue; replaced if logging is reconfigured
+_listener: Optional[QueueListener] = None
+
+
+class OrjsonFormatter(jsonlogger.JsonFormatter):
+    """`JsonFormatter` that serializes log records with orjson."""
+
+    def jsonify_log_record(self, log_record: Dict[str, Any]) -> str:  # noqa: D102
+        # Match the stock encoder: accept non-str dict keys and fall back to str()
+        # for values orjson cannot encode, so odd `extra` fields never drop a record.
+        return orjson.dumps(
+            log_record, default=self.json_default or str, option=orjson.OPT_NON_STR_KEYS
+        ).decode()
+
+
+class _InProcessQueueHandler(QueueHandler):
+    """Queue handler that leaves formatting to the listener thread.
+
+    The stdlib `QueueHandler.prepare` formats each record on the calling thread
+    so it can be pickled. The queue here never leaves the process, so only the
+    message arguments are resolved up front (they may be mutated later) and the
+    exception info is passed through for the JSON formatter.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:  # noqa: D102
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+def _stop_listener() -> None:
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
 
 def setup_logging(settings: Settings) -> None:
     """Configure the root logger for the application."""
 
+    global _listener
+
     log_level = settings.LOG_LEVEL.upper()
 
     # Create a custom JSON formatter
-    formatter = jsonlogger.JsonFormatter("%(asctime)s %(name)s %(levelname)s %(message)s")
+    formatter = OrjsonFormatter("%(asctime)s %(name)s %(levelname)s %(message)s")
 
     # Get the root logger and remove existing handlers
     logger = logging.getLogger()
@@ -25,13 +72,18 @@ def setup_logging(settings: Settings) -> None:
     # Avoid adding duplicate handlers if this function is called multiple times
     if logger.hasHandlers():
         logger.handlers.clear()
+    _stop_listener()
 
-    # Create a handler to stream logs to standard output
+    # Create a handler to stream logs to standard output; it runs on the listener thread
     handler = logging.StreamHandler(sys.stdout)
     handler.setFormatter(formatter)
 
-    # Add the handler to the root logger
-    logger.addHandler(handler)
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    _listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    _listener.start()
+
+    # Add only the non-blocking queue handler to the root logger
+    logger.addHandler(_InProcessQueueHandler(log_queue))
     logger.setLevel(log_level)
 
     # Suppress noisy loggers from common libraries
@@ -42,6 +94,10 @@ def setup_logging(settings: Settings) -> None:
     logger.info("Logging configured with level: %s", log_level)
 
 
+# Flush queued records before the interpreter exits
+atexit.register(_stop_listener)
+
+
 def get_logger(name: str) -> logging.Logger:
     """Retrieve a logger instance with the specified name."""
 
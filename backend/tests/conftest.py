@@ -0,0 +1,10 @@
+"""Shared test setup.
+
+`Settings` requires a few environment variables at import time; tests never
+reach the real services, so placeholder values are enough.
+"""
+import os
+
+os.environ.setdefault("GEMINI_API_KEY", "test-key")
+os.environ.setdefault("DATA_COLLECTOR_URL", "http://data-collector.test")
+os.environ.setdefault("TOOL_EXECUTOR_URL", "http://tool-executor.test")
@@ -0,0 +1,72 @@
+"""Unit tests for batching of WebSocket node updates."""
+import asyncio
+
+import orjson
+import pytest
+
+from app.api.websockets.coalescer import BroadcastCoalescer
+from app.api.websockets.connection_manager import connection_manager
+from app.models.agent_node import AgentNode, NodeType
+
+
+@pytest.fixture
+def sent(monkeypatch):
+    """Capture every payload the coalescer hands to the connection manager."""
+
+    messages = []
+    monkeypatch.setattr(
+        connection_manager,
+        "queue_broadcast",
+        lambda workflow_id, payload: messages.append((workflow_id, orjson.loads(payload))),
+    )
+    return messages
+
+
+def _node(node_id):
+    return AgentNode(id=node_id, label=node_id, type=NodeType.TOOL)
+
+
+def test_updates_within_window_are_sent_as_one_batch(sent):
+    async def scenario():
+        coalescer = BroadcastCoalescer(delay=0.01, max_batch=10)
+        coalescer.enqueue("wf", _node("a"))
+        coalescer.enqueue("wf", _node("b"))
+        coalescer.enqueue("wf", _node("a"))
+        assert sent == []
+        await asyncio.sleep(0.05)
+
+    asyncio.run(scenario())
+    assert len(sent) == 1
+    workflow_id, event = sent[0]
+    assert workflow_id == "wf"
+    assert event["type"] == "node_batch"
+    assert [node["id"] for node in event["payload"]] == ["a", "b"]
+
+
+def test_full_batch_is_sent_without_waiting_for_window(sent):
+    async def scenario():
+        coalescer = BroadcastCoalescer(delay=60, max_batch=2)
+        coalescer.enqueue("wf", _node("a"))
+        coalescer.enqueue("wf", _node("b"))
+        batch_sent = list(sent)
+        coalescer.enqueue("wf", _node("c"))
+        await coalescer.flush("wf")
+        return batch_sent
+
+    batch_sent = asyncio.run(scenario())
+    assert [[node["id"] for node in event["payload"]] for _, event in batch_sent] == [["a", "b"]]
+    assert sent[1][1]["type"] == "node"
+    assert sent[1][1]["payload"]["id"] == "c"
+
+
+def test_send_now_flushes_buffered_updates_first(sent):
+    async def scenario():
+        coalescer = BroadcastCoalescer(delay=60, max_batch=10)
+        coalescer.enqueue("wf", _node("a"))
+        coalescer.enqueue_text("wf", "Answer", "Hello, ")
+        coalescer.enqueue_text("wf", "Answer", "world")
+        await coalescer.send_now("wf", orjson.dumps({"type": "final"}).decode())
+
+    asyncio.run(scenario())
+    assert [event["type"] for _, event in sent] == ["node", "commentary", "final"]
+    assert sent[1][1]["payload"]["content"] == "Hello, world"
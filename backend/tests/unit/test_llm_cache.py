@@ -0,0 +1,44 @@
+"""Unit tests for the in-process LLM cache backend."""
+import asyncio
+
+from app.llm import cache
+from app.llm.cache import LLMCache, MemoryCacheBackend
+
+
+def test_least_recently_used_entry_is_evicted():
+    async def scenario():
+        backend = MemoryCacheBackend(max_entries=2)
+        await backend.set("a", "1")
+        await backend.set("b", "2")
+        assert await backend.get("a") == "1"  # "b" is now least recently used
+        await backend.set("c", "3")
+        return [await backend.get(key) for key in ("a", "b", "c")]
+
+    assert asyncio.run(scenario()) == ["1", None, "3"]
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now[0])
+
+    async def scenario():
+        backend = MemoryCacheBackend()
+        await backend.set("short", "x", ttl=10)
+        await backend.set("forever", "y")
+        before = await backend.get("short")
+        now[0] += 10
+        return before, await backend.get("short"), await backend.get("forever")
+
+    assert asyncio.run(scenario()) == ("x", None, "y")
+
+
+def test_hits_and_misses_are_counted():
+    async def scenario():
+        llm_cache = LLMCache(MemoryCacheBackend())
+        await llm_cache.get("missing")
+        await llm_cache.set("key", "value")
+        await llm_cache.get("key")
+        llm_cache.record_hit()
+        return llm_cache.hits, llm_cache.misses
+
+    assert asyncio.run(scenario()) == (2, 1)
@@ -0,0 +1,38 @@
+"""Unit tests for the orjson-backed JSON log formatter."""
+import logging
+import sys
+
+import orjson
+
+from app.utils.logging import OrjsonFormatter
+
+
+def _format(message, exc_info=None, **extra):
+    record = logging.LogRecord("test", logging.INFO, __file__, 1, message, None, exc_info)
+    record.__dict__.update(extra)
+    return orjson.loads(OrjsonFormatter("%(name)s %(levelname)s %(message)s").format(record))
+
+
+def test_non_str_keys_are_stringified():
+    output = _format("x", mapping={1: "a", None: "b"})
+    assert output["mapping"] == {"1": "a", "null": "b"}
+
+
+def test_unencodable_values_fall_back_to_str():
+    class Opaque:
+        def __str__(self):
+            return "opaque"
+
+    output = _format("x", obj=Opaque(), details={"nested": Opaque()})
+    assert output["obj"] == "opaque"
+    assert output["details"] == {"nested": "opaque"}
+
+
+def test_exception_info_is_included():
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        output = _format("failed", exc_info=sys.exc_info())
+
+    assert output["message"] == "failed"
+    assert "ValueError: boom" in output["exc_info"]
@@ -0,0 +1,117 @@
+"""Unit tests for plan execution in `AgentOrchestrator`, with fake LLM and tools."""
+import asyncio
+
+from app.agents.orchestrator import AgentOrchestrator
+from app.models.agent_node import NodeStatus
+from app.state.workflow_state import workflow_state_manager
+
+CANCELLED = "Cancelled after another step failed."
+
+
+class FakeLLM:
+    """Returns a fixed plan and a one-chunk final answer."""
+
+    def __init__(self, plan):
+        self.plan = plan
+
+    async def generate_plan(self, prompt):
+        return self.plan
+
+    async def generate_synthesis_stream(self, prompt):
+        yield "answer"
+
+
+class FakeTools:
+    """Runs each tool according to its entry in ``behaviour``.
+
+    A number sleeps for that many seconds and succeeds, "error" returns a
+    non-success result and "raise" raises.
+    """
+
+    def __init__(self, **behaviour):
+        self.behaviour = behaviour
+        self.started = []
+
+    async def execute_tool(self, tool_name, parameters):
+        self.started.append(tool_name)
+        action = self.behaviour.get(tool_name, 0)
+        if action == "raise":
+            raise RuntimeError(f"{tool_name} exploded")
+        if action == "error":
+            return {"status": "error", "output": f"{tool_name} failed"}
+        await asyncio.sleep(action)
+        return {"status": "success", "output": {"tool": tool_name}}
+
+
+def _plan(*nodes, edges=()):
+    return {
+        "nodes": [
+            {"id": node_id, "label": node_id, "data": {"tool_name": node_id}}
+            for node_id in nodes
+        ],
+        "edges": [{"from": src, "to": dst} for src, dst in edges],
+    }
+
+
+def _run(plan, tools):
+    """Run a workflow to completion and return ``{label: (status, error)}``."""
+
+    async def scenario():
+        workflow = workflow_state_manager.create_workflow(session_id="test", query="q")
+        orchestrator = AgentOrchestrator(workflow.id, llm_client=FakeLLM(plan))
+        orchestrator.tool_executor = tools
+        await asyncio.wait_for(orchestrator.run(), timeout=5)
+        nodes = workflow_state_manager.get_workflow(workflow.id).node_tree.values()
+        return {node.label: (node.status, node.data.error) for node in nodes}
+
+    return asyncio.run(scenario())
+
+
+def test_raising_tool_cancels_running_sibling():
+    tools = FakeTools(boom="raise", slow=30)
+    nodes = _run(_plan("boom", "slow"), tools)
+
+    assert nodes["boom"] == (NodeStatus.FAILED, "boom exploded")
+    assert nodes["slow"] == (NodeStatus.FAILED, CANCELLED)
+    assert "Synthesize Final Answer" not in nodes
+
+
+def test_unstarted_dependents_fail_when_a_step_raises():
+    tools = FakeTools(slow=30, boom="raise")
+    nodes = _run(
+        _plan("slow", "after_slow", "boom", edges=[("slow", "after_slow")]), tools
+    )
+
+    assert "after_slow" not in tools.started
+    assert nodes["slow"] == (NodeStatus.FAILED, CANCELLED)
+    assert nodes["after_slow"] == (NodeStatus.FAILED, CANCELLED)
+
+
+def test_non_success_result_only_fails_its_descendants():
+    tools = FakeTools(bad="error")
+    nodes = _run(
+        _plan(
+            "bad", "after_bad", "last", "good", "after_good",
+            edges=[("bad", "after_bad"), ("after_bad", "last"), ("good", "after_good")],
+        ),
+        tools,
+    )
+
+    assert nodes["bad"] == (NodeStatus.FAILED, "bad failed")
+    assert nodes["after_bad"] == (NodeStatus.FAILED, "Upstream dependency failed.")
+    assert nodes["last"] == (NodeStatus.FAILED, "Upstream dependency failed.")
+    assert nodes["good"][0] == NodeStatus.COMPLETED
+    assert nodes["after_good"][0] == NodeStatus.COMPLETED
+    assert nodes["Synthesize Final Answer"][0] == NodeStatus.COMPLETED
+    assert sorted(tools.started) == ["after_good", "bad", "good"]
+
+
+def test_cyclic_plan_fails_planner_before_creating_steps():
+    tools = FakeTools()
+    nodes = _run(_plan("a", "b", edges=[("a", "b"), ("b", "a")]), tools)
+
+    status, error = nodes["Planning"]
+    assert status == NodeStatus.FAILED
+    assert "cycle" in error
+    assert "a" not in nodes and "b" not in nodes
+    assert tools.started == []
@@ -0,0 +1,59 @@
+"""Unit tests for the persistent semantic plan cache."""
+import asyncio
+
+from app.llm.plan_cache import PlanCache
+
+
+def _cache(tmp_path, max_entries=2):
+    return PlanCache(
+        db_path=str(tmp_path / "plans.sqlite3"),
+        threshold=0.9,
+        embedding_model="unused",
+        max_entries=max_entries,
+    )
+
+
+def _plan(label):
+    return {"nodes": [{"id": "n1", "label": label, "status": "completed"}], "edges": []}
+
+
+def test_least_recently_used_plan_is_evicted(tmp_path):
+    async def scenario():
+        plan_cache = _cache(tmp_path)
+        await plan_cache.store("a", [1.0, 0.0, 0.0], _plan("a"))
+        await plan_cache.store("b", [0.0, 1.0, 0.0], _plan("b"))
+        await plan_cache.lookup([1.0, 0.0, 0.0])  # "b" is now least recently used
+        await plan_cache.store("c", [0.0, 0.0, 1.0], _plan("c"))
+        return [
+            await plan_cache.lookup(embedding)
+            for embedding in ([1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0])
+        ]
+
+    hit_a, hit_b, hit_c = asyncio.run(scenario())
+    assert hit_a["nodes"][0]["label"] == "a"
+    assert hit_b is None
+    assert hit_c["nodes"][0]["label"] == "c"
+
+
+def test_plans_survive_reload(tmp_path):
+    async def scenario():
+        await _cache(tmp_path).store("a", [1.0, 0.0], _plan("a"))
+        return await _cache(tmp_path).lookup([1.0, 0.0])
+
+    assert asyncio.run(scenario()) == {
+        "nodes": [{"id": "n1", "label": "a"}],
+        "edges": [],
+    }
+
+
+def test_evicted_plans_are_removed_from_disk(tmp_path):
+    async def scenario():
+        plan_cache = _cache(tmp_path, max_entries=1)
+        await plan_cache.store("a", [1.0, 0.0], _plan("a"))
+        await plan_cache.store("b", [0.0, 1.0], _plan("b"))
+        reloaded = _cache(tmp_path, max_entries=1)
+        return await reloaded.lookup([1.0, 0.0]), await reloaded.lookup([0.0, 1.0])
+
+    evicted, kept = asyncio.run(scenario())
+    assert evicted is None
+    assert kept["nodes"][0]["label"] == "b"
@@ -0,0 +1,55 @@
+"""Unit tests for the ready-set scheduler state in `app.agents.runtime`."""
+import pytest
+
+from app.agents.runtime import WorkflowRuntime
+from app.core.exceptions import LLMResponseError
+from app.models.agent_node import NodeStatus
+
+
+def _plan(*nodes, edges=()):
+    return {
+        "nodes": [{"id": node_id, "depends_on": list(deps)} for node_id, deps in nodes],
+        "edges": [{"from": src, "to": dst} for src, dst in edges],
+    }
+
+
+def test_diamond_runs_join_only_after_both_branches():
+    runtime = WorkflowRuntime.from_plan(
+        _plan(("a", []), ("b", ["a"]), ("c", []), ("d", ["b", "c"]), edges=[("a", "c")])
+    )
+
+    assert runtime.roots() == ["a"]
+    ready, blocked = runtime.settle("a", True)
+    assert (sorted(ready), blocked) == (["b", "c"], [])
+    assert runtime.settle("b", True) == ([], [])
+    assert runtime.status_by_id["d"] == NodeStatus.WAITING.value
+    assert runtime.settle("c", True) == (["d"], [])
+    assert runtime.status_by_id["d"] == NodeStatus.PROCESSING.value
+
+
+def test_failed_upstream_blocks_all_descendants():
+    runtime = WorkflowRuntime.from_plan(
+        _plan(("a", []), ("b", ["a"]), ("c", ["b"]), ("x", []), ("y", ["a", "x"]))
+    )
+
+    assert sorted(runtime.roots()) == ["a", "x"]
+    assert runtime.settle("x", True) == ([], [])
+    ready, blocked = runtime.settle("a", False)
+
+    assert ready == []
+    assert sorted(blocked) == ["b", "c", "y"]
+    for node_id in ("a", "b", "c", "y"):
+        assert runtime.status_by_id[node_id] == NodeStatus.FAILED.value
+    assert runtime.status_by_id["x"] == NodeStatus.COMPLETED.value
+
+
+def test_cycle_is_rejected():
+    with pytest.raises(LLMResponseError, match="cycle"):
+        WorkflowRuntime.from_plan(_plan(("root", []), ("a", ["b"]), ("b", ["a"])))
+
+
+def test_malformed_nodes_are_rejected():
+    with pytest.raises(LLMResponseError):
+        WorkflowRuntime.from_plan({"nodes": [{"label": "no id"}]})
+    with pytest.raises(LLMResponseError):
+        WorkflowRuntime.from_plan(_plan(("a", []), ("a", [])))
@@ -159,12 +159,17 @@ function App() {
       ws.onopen = () => setIsConnecting(false);
       ws.onmessage = (event) => {
         const message = JSON.parse(event.data);
-        if (message.type === 'node' && message.payload) {
+        let updates: AgentNode[] = [];
+        if (message.type === 'node' && message.payload) updates = [message.payload];
+        else if (message.type === 'node_batch' && Array.isArray(message.payload)) updates = message.payload;
+        if (updates.length) {
           setNodes(prevNodes => {
             const newNodes = [...prevNodes];
-            const index = newNodes.findIndex(n => n.id === message.payload.id);
-            if (index > -1) newNodes[index] = message.payload;
-            else newNodes.push(message.payload);
+            for (const update of updates) {
+              const index = newNodes.findIndex(n => n.id === update.id);
+              if (index > -1) newNodes[index] = update;
+              else newNodes.push(update);
+            }
             return newNodes;
           });
         }
@@ -6,20 +6,38 @@ corresponding logic via the Data Collector or other subsystems.
 from __future__ import annotations
 
 import os
+from contextlib import asynccontextmanager
 
 import httpx
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from pydantic import BaseModel
 
+# Environment-configurable endpoint for Data Collector
+DATA_COLLECTOR_URL = os.getenv("DATA_COLLECTOR_URL", "http://data-collector:8000")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):  # noqa: ANN201
+    """Share one pooled Data Collector client across all tool calls."""
+
+    app.state.http = httpx.AsyncClient(
+        base_url=DATA_COLLECTOR_URL,
+        timeout=10.0,
+        limits=httpx.Limits(max_keepalive_connections=64, max_connections=128),
+    )
+    try:
+        yield
+    finally:
+        await app.state.http.aclose()
+
+
 app = FastAPI(
     title="Cortex Tool Executor",
     description="Executes tool calls requested by the agent.",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
-# Environment-configurable endpoint for Data Collector
-DATA_COLLECTOR_URL = os.getenv("DATA_COLLECTOR_URL", "http://data-collector:8000")
-
 
 class ToolCallRequest(BaseModel):
     tool_name: str
@@ -32,7 +50,7 @@ class ToolCallRequest(BaseModel):
 async def execute_metrics_tool(params: dict[str, object], client: httpx.AsyncClient):
     """Handler to fetch metrics via Data Collector."""
 
-    response = await client.post(f"{DATA_COLLECTOR_URL}/metrics", json=params)
+    response = await client.post("/metrics", json=params)
     response.raise_for_status()
     return response.json()
 
@@ -40,7 +58,7 @@ async def execute_metrics_tool(params: dict[str, object], client: httpx.AsyncCli
 async def execute_logs_tool(params: dict[str, object], client: httpx.AsyncClient):
     """Handler to fetch logs via Data Collector."""
 
-    response = await client.post(f"{DATA_COLLECTOR_URL}/logs", json=params)
+    response = await client.post("/logs", json=params)
     response.raise_for_status()
     return response.json()
 
@@ -61,7 +79,7 @@ def health_check() -> dict[str, str]:  # noqa: D401
 
 
 @app.post("/execute")
-async def execute_tool(request: ToolCallRequest):  # noqa: D401, ANN201
+async def execute_tool(request: ToolCallRequest, http_request: Request):  # noqa: D401, ANN201
     """Endpoint to execute a requested tool."""
 
     tool_name = request.tool_name
@@ -73,8 +91,7 @@ async def execute_tool(request: ToolCallRequest):  # noqa: D401, ANN201
     handler = TOOL_REGISTRY[tool_name]
 
     try:
-        async with httpx.AsyncClient() as client:
-            result = await handler(request.parameters, client)
+        result = await handler(request.parameters, http_request.app.state.http)
 
         print("Execution successful for tool:", tool_name)
         return {"status": "success", "output": result}